@@ -10,22 +10,26 @@ Start with:
 from __future__ import annotations
 
 import atexit
-import dataclasses
+import functools
 import gc
+import heapq
 import os
+import re
 import sys
 import time
 import threading
-from concurrent.futures import ThreadPoolExecutor
-from datetime import datetime, date, timedelta
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from datetime import datetime, date, timedelta, timezone
 from typing import Optional
 from zoneinfo import ZoneInfo
 
 # Ensure the project root is on sys.path so all src/ imports work
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
-from fastapi import Depends, FastAPI, HTTPException, Query
+import numpy as np
+from fastapi import BackgroundTasks, Depends, FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 import config
@@ -37,7 +41,13 @@ from src.analysis import bet_builder, prop_grader, results_checker
 from src.models import BetLeg, BetSlip, FactorResult, NBAGame, PlayerProp, ValuedProp
 from backend.auth import require_admin, require_user, router as auth_router
 
-app = FastAPI(title="PickAParlay API", version="1.0.0")
+# orjson serialises the large list responses (/api/props, /api/slips,
+# /api/history) several times faster than the stdlib encoder
+app = FastAPI(
+    title="PickAParlay API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+)
 
 # Register auth endpoints
 app.include_router(auth_router)
@@ -68,6 +78,12 @@ from apscheduler.schedulers.background import BackgroundScheduler
 
 _scheduler = BackgroundScheduler(timezone=_LONDON)
 
+# Single-worker executors for the cron-launched pipelines. Submitting reuses
+# one long-lived thread instead of paying a fresh stack allocation per spawn,
+# and caps each pipeline at one run at a time at the executor level.
+_refresh_exec = ThreadPoolExecutor(max_workers=1, thread_name_prefix="refresh-job")
+_results_exec = ThreadPoolExecutor(max_workers=1, thread_name_prefix="results-job")
+
 
 def _scheduled_grade_results() -> None:
     """Grade last night's results. NBA dates are Eastern Time, so 6 AM London
@@ -79,11 +95,9 @@ def _scheduled_grade_results() -> None:
         if _results_state["status"] == "running":
             print("[cron] Results check already running — skipping")
             return
+        _swap_state("_results_state", status="running")
 
-    t = threading.Thread(
-        target=_run_results_background, args=(yesterday_et,), daemon=True
-    )
-    t.start()
+    _results_exec.submit(_run_results_background, yesterday_et)
 
 
 def _scheduled_grade_results_tonight() -> None:
@@ -99,14 +113,12 @@ def _scheduled_grade_results_tonight() -> None:
         if _results_state["status"] == "running":
             print("[cron-night] Results check already running — skipping")
             return
+        _swap_state("_results_state", status="running")
 
     for game_date in [today_et, yesterday_et]:
         print(f"[cron-night] Grading results for {game_date}")
-        t = threading.Thread(
-            target=_run_results_background, args=(game_date,), daemon=True
-        )
-        t.start()
-        t.join(timeout=300)  # wait up to 5 min per date before moving on
+        fut = _results_exec.submit(_run_results_background, game_date)
+        wait([fut], timeout=300)  # wait up to 5 min per date before moving on
 
 
 def _scheduled_refresh() -> None:
@@ -122,12 +134,10 @@ def _scheduled_refresh() -> None:
         if _refresh_state["running"]:
             print("[cron] Refresh already running — skipping scheduled refresh")
             return
+        _swap_state("_refresh_state", running=True)
 
     print(f"[cron] Starting scheduled refresh (credits remaining: {remaining})")
-    t = threading.Thread(
-        target=_run_refresh_background, args=(config.DEFAULT_SEASON,), daemon=True
-    )
-    t.start()
+    _refresh_exec.submit(_run_refresh_background, config.DEFAULT_SEASON)
 
 
 @app.on_event("startup")
@@ -167,6 +177,11 @@ def startup() -> None:
 @app.on_event("shutdown")
 def shutdown() -> None:
     _scheduler.shutdown(wait=False)
+    _refresh_exec.shutdown(wait=False, cancel_futures=True)
+    _results_exec.shutdown(wait=False, cancel_futures=True)
+    # Close pooled HTTP connections held by the API modules
+    odds_api._session.close()
+    injury_api._session.close()
     print("[shutdown] Scheduler stopped")
 
 
@@ -188,39 +203,70 @@ _refresh_state: dict = {
 _refresh_lock = threading.Lock()
 
 
-def _run_refresh_background(season: str) -> None:
-    global _refresh_state
+def _swap_state(name: str, **updates) -> None:
+    """Publish a job-state update by rebinding the module-level dict.
 
-    with _refresh_lock:
-        _refresh_state.update(
-            running=True,
-            started_at=datetime.utcnow().isoformat(),
-            finished_at=None,
-            status="running",
-            props_graded=0,
-            props_total=0,
-            run_id=None,
-            error=None,
-        )
+    Rebinding a global is one atomic bytecode op in CPython, so status
+    endpoints can read a consistent snapshot without taking a lock — the
+    published dict is never mutated in place. Each job has a single writer
+    thread; the per-job locks only guard the not-running → running
+    transition in the trigger endpoints and cron callbacks.
+    """
+    g = globals()
+    g[name] = {**g[name], **updates}
+
+
+def _resolve_player_ids(raw_by_event: dict[str, list[dict]]) -> dict[str, int]:
+    """Resolve every unique player name across all events in one concurrent batch.
+
+    Replaces the old per-name lookups inside the per-game loop — name
+    resolution latency becomes ~one round trip instead of one per player.
+    """
+    all_names = sorted({
+        rp["player_name"] for raw in raw_by_event.values() for rp in raw
+    })
+    if not all_names:
+        return {}
+    with ThreadPoolExecutor(max_workers=16) as id_pool:
+        resolved = id_pool.map(nba_stats.get_player_id, all_names)
+    return {name: pid for name, pid in zip(all_names, resolved) if pid}
+
+
+def _now() -> str:
+    """Timestamp for job-state display. utcnow() is deprecated in 3.12+."""
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+def _run_refresh_background(season: str) -> None:
+    _swap_state(
+        "_refresh_state",
+        running=True,
+        started_at=_now(),
+        finished_at=None,
+        status="running",
+        props_graded=0,
+        props_total=0,
+        run_id=None,
+        error=None,
+    )
 
     try:
         # 1. Tonight's games (force_fresh=True to get live game statuses,
         #    bypassing stale cache that may include now-in-progress games)
         games = nba_stats.get_todays_games(force_fresh=True)
         if not games:
-            with _refresh_lock:
-                _refresh_state.update(
-                    running=False,
-                    finished_at=datetime.utcnow().isoformat(),
-                    status="no_games",
-                )
+            _swap_state(
+                "_refresh_state",
+                running=False,
+                finished_at=_now(),
+                status="no_games",
+            )
             return
 
         def _log(msg: str, detail: str = "") -> None:
             """Print to terminal and update refresh state detail."""
             print(f"[refresh] {msg}")
-            with _refresh_lock:
-                _refresh_state["detail"] = detail or msg
+            _swap_state("_refresh_state", detail=detail or msg)
 
         _log(f"🏀 Found {len(games)} games tonight")
 
@@ -251,21 +297,31 @@ def _run_refresh_background(season: str) -> None:
             _log(f"⚠️ {len(unmatched_games)} games unmatched: {', '.join(unmatched_games)}")
         _log(f"✅ Matched {matched_games}/{len(games)} games to Odds API")
 
+        # Fetch raw props for all games concurrently (one HTTP round trip of
+        # latency instead of N), then resolve every unique player name in one
+        # concurrent batch instead of a round trip per name.
+        for game in games:
+            if not game.odds_event_id:
+                _log(f"  ⏭️ {game.away_team} @ {game.home_team} — no odds event, skipping")
+        event_ids = [g.odds_event_id for g in games if g.odds_event_id]
+        _log(f"  📥 Fetching props for {len(event_ids)} games…", "Fetching props")
+        with ThreadPoolExecutor(max_workers=8) as fetch_pool:
+            raw_by_event: dict[str, list[dict]] = dict(zip(
+                event_ids,
+                fetch_pool.map(
+                    lambda eid: odds_api.get_player_props_for_event(eid, force_fresh=True),
+                    event_ids,
+                ),
+            ))
+
+        player_id_map = _resolve_player_ids(raw_by_event)
+
         all_raw_props: list = []
         for gi, game in enumerate(games):
-            matchup = f"{game.away_team} @ {game.home_team}"
-            if not game.odds_event_id:
-                _log(f"  ⏭️ [{gi+1}/{len(games)}] {matchup} — no odds event, skipping")
+            raw = raw_by_event.get(game.odds_event_id)
+            if raw is None:
                 continue
-            _log(f"  📥 [{gi+1}/{len(games)}] {matchup} — fetching props…", f"Fetching props: {matchup}")
-            raw = odds_api.get_player_props_for_event(game.odds_event_id, force_fresh=True)
-            player_id_map: dict[str, int] = {}
-            for rp in raw:
-                name = rp["player_name"]
-                if name not in player_id_map:
-                    pid = nba_stats.get_player_id(name)
-                    if pid:
-                        player_id_map[name] = pid
+            matchup = f"{game.away_team} @ {game.home_team}"
             props = odds_api.build_player_props(raw, game, player_id_map)
             unique_players = len({p.player_name for p in props})
             _log(f"  ✅ [{gi+1}/{len(games)}] {matchup} — {len(props)} props across {unique_players} players")
@@ -281,16 +337,15 @@ def _run_refresh_background(season: str) -> None:
                 deduped.append(p)
         all_raw_props = deduped
 
-        with _refresh_lock:
-            _refresh_state["props_total"] = len(all_raw_props)
+        _swap_state("_refresh_state", props_total=len(all_raw_props))
 
         if not all_raw_props:
-            with _refresh_lock:
-                _refresh_state.update(
-                    running=False,
-                    finished_at=datetime.utcnow().isoformat(),
-                    status="no_props",
-                )
+            _swap_state(
+                "_refresh_state",
+                running=False,
+                finished_at=_now(),
+                status="no_props",
+            )
             return
 
         # 4a. Pre-warm cache — fetch ALL data upfront in parallel
@@ -353,11 +408,13 @@ def _run_refresh_background(season: str) -> None:
         # Free prefetch references to reduce memory pressure during grading
         del unique_pids, _pid_to_name
         gc.collect()
-        with _refresh_lock:
-            _refresh_state["status"] = "grading"
+        _swap_state("_refresh_state", status="grading")
 
-        # 4b. Grade props (both OVER and UNDER sides) — fast now, all cache hits
-        #     Save incrementally every 50 props so progress survives crashes.
+        # 4b. Grade props (both OVER and UNDER sides) in parallel.
+        #     Grading is I/O-bound (stats/spread/injury lookups), so a thread
+        #     pool overlaps the waits — near-linear speedup over the old
+        #     serial loop. Save incrementally every 50 props so progress
+        #     survives crashes.
         #
         #     Memory note: we NO LONGER keep ValuedProp objects alive after
         #     serialisation. Each batch is converted to plain dicts immediately
@@ -369,56 +426,65 @@ def _run_refresh_background(season: str) -> None:
         all_upserted_ids: list[int] = []  # accumulated across ALL batches for finalize
         above_threshold = 0
         graded_count = 0
-        _current_player = ""
         _unsaved_batch: list[ValuedProp] = []
         game_date = games[0].game_date if games else None
         BATCH_SIZE = 50
 
-        for i, prop in enumerate(all_raw_props):
-            # Log when we move to a new player
-            if prop.player_name != _current_player:
-                _current_player = prop.player_name
-                player_props = sum(1 for p in all_raw_props if p.player_name == _current_player)
-                _log(f"  📊 [{i+1}/{len(all_raw_props)}] Grading {_current_player} ({player_props} markets)…",
-                     f"Grading: {_current_player} ({i+1}/{len(all_raw_props)})")
-
-            vp_over = prop_grader.grade_prop(prop, injuries, season=season, side="over")
-            if vp_over is not None:
-                _unsaved_batch.append(vp_over)
-            # Grade UNDER if a valid under price exists
-            if prop.under_odds_decimal and prop.under_odds_decimal > 1.0:
-                vp_under = prop_grader.grade_prop(prop, injuries, season=season, side="under")
-                if vp_under is not None:
-                    _unsaved_batch.append(vp_under)
-            with _refresh_lock:
-                _refresh_state["props_graded"] = i + 1
-
-            # Flush batch: serialise → DB (no stale-mark yet) → cache checkpoint → free
-            # mark_stale=False is critical: stale-marking happens ONCE at the end
-            # via finalize_graded_props(), using ALL IDs from the full refresh.
-            # Without this, each intermediate batch would deactivate the previous
-            # batches, leaving only the last ~N props marked is_active=1.
-            if len(_unsaved_batch) >= BATCH_SIZE and game_date:
-                batch_dicts = [dataclasses.asdict(vp) for vp in _unsaved_batch]
-                ids = database.upsert_graded_props(_unsaved_batch, game_date, mark_stale=False)
-                all_upserted_ids.extend(ids)
-                above_threshold += sum(
-                    1 for vp in _unsaved_batch if vp.value_score >= config.MIN_VALUE_SCORE
-                )
-                graded_count += len(_unsaved_batch)
-                all_prop_dicts.extend(batch_dicts)
-                del _unsaved_batch, batch_dicts
-                gc.collect()
-                _unsaved_batch = []
-
-                # Checkpoint cache every ~200 props so /api/props has data
-                # even if refresh crashes before finishing
-                if len(all_prop_dicts) % 200 < BATCH_SIZE:
-                    cache.save_scored_props(all_prop_dicts)
+        # One task per (prop, side) — UNDER only when a valid under price exists
+        tasks: list[tuple] = [(p, "over") for p in all_raw_props]
+        tasks += [
+            (p, "under")
+            for p in all_raw_props
+            if p.under_odds_decimal and p.under_odds_decimal > 1.0
+        ]
+        _swap_state("_refresh_state", props_total=len(tasks))
+
+        with ThreadPoolExecutor(max_workers=config.GRADER_WORKERS) as grade_pool:
+            futures = [
+                grade_pool.submit(prop_grader.grade_prop, p, injuries, season=season, side=s)
+                for p, s in tasks
+            ]
+            for done, fut in enumerate(as_completed(futures), 1):
+                try:
+                    vp = fut.result()
+                except Exception:
+                    vp = None
+                if vp is not None:
+                    _unsaved_batch.append(vp)
+                # Swap state every 16 completions, not per prop — amortises
+                # the per-update dict rebuild across the hot loop
+                if done % 16 == 0 or done == len(tasks):
+                    _swap_state("_refresh_state", props_graded=done)
+                if done % 25 == 0 or done == len(tasks):
+                    _log(f"  📊 Graded {done}/{len(tasks)} prop sides…",
+                         f"Grading props ({done}/{len(tasks)})")
+
+                # Flush batch: serialise → DB (no stale-mark yet) → cache checkpoint → free
+                # mark_stale=False is critical: stale-marking happens ONCE at the end
+                # via finalize_graded_props(), using ALL IDs from the full refresh.
+                # Without this, each intermediate batch would deactivate the previous
+                # batches, leaving only the last ~N props marked is_active=1.
+                if len(_unsaved_batch) >= BATCH_SIZE and game_date:
+                    batch_dicts = [vp.to_dict() for vp in _unsaved_batch]
+                    ids = database.upsert_graded_props(_unsaved_batch, game_date, mark_stale=False)
+                    all_upserted_ids.extend(ids)
+                    above_threshold += sum(
+                        1 for vp in _unsaved_batch if vp.value_score >= config.MIN_VALUE_SCORE
+                    )
+                    graded_count += len(_unsaved_batch)
+                    all_prop_dicts.extend(batch_dicts)
+                    del _unsaved_batch, batch_dicts
+                    gc.collect()
+                    _unsaved_batch = []
+
+                    # Checkpoint cache every ~200 props so /api/props has data
+                    # even if refresh crashes before finishing
+                    if len(all_prop_dicts) % 200 < BATCH_SIZE:
+                        cache.save_scored_props(all_prop_dicts)
 
         # Flush the final partial batch (also no stale-mark yet)
         if _unsaved_batch and game_date:
-            batch_dicts = [dataclasses.asdict(vp) for vp in _unsaved_batch]
+            batch_dicts = [vp.to_dict() for vp in _unsaved_batch]
             ids = database.upsert_graded_props(_unsaved_batch, game_date, mark_stale=False)
             all_upserted_ids.extend(ids)
             above_threshold += sum(
@@ -451,7 +517,10 @@ def _run_refresh_background(season: str) -> None:
         del all_prop_dicts, all_raw_props
         gc.collect()
 
-        elapsed = (datetime.utcnow() - datetime.fromisoformat(_refresh_state["started_at"])).total_seconds()
+        elapsed = (
+            datetime.now(timezone.utc)
+            - datetime.fromisoformat(_refresh_state["started_at"])
+        ).total_seconds()
         _log(
             f"🏁 Done! {graded_count} graded props "
             f"({above_threshold} above threshold) from {len(games)} games "
@@ -459,48 +528,55 @@ def _run_refresh_background(season: str) -> None:
             "done",
         )
 
-        with _refresh_lock:
-            _refresh_state.update(
-                running=False,
-                finished_at=datetime.utcnow().isoformat(),
-                status="done",
-                props_graded=graded_count,
-                run_id=run_id,
-            )
+        _swap_state(
+            "_refresh_state",
+            running=False,
+            finished_at=_now(),
+            status="done",
+            props_graded=graded_count,
+            run_id=run_id,
+        )
 
     except Exception as exc:
-        with _refresh_lock:
-            _refresh_state.update(
-                running=False,
-                finished_at=datetime.utcnow().isoformat(),
-                status="error",
-                error=str(exc),
-            )
+        _swap_state(
+            "_refresh_state",
+            running=False,
+            finished_at=_now(),
+            status="error",
+            error=str(exc),
+        )
 
 
 # ---------------------------------------------------------------------------
 # Reconstruction helpers
 # ---------------------------------------------------------------------------
 
+def _fast_new(cls, d: dict):
+    """Build a dataclass instance without running its generated __init__ —
+    reconstruction runs over thousands of cached dicts per request cycle
+    and the dict keys are our own to_dict() output, so they match the
+    fields exactly."""
+    obj = object.__new__(cls)
+    obj.__dict__ = d
+    return obj
+
+
 def _vp_from_dict(d: dict) -> ValuedProp:
-    game_d = d["prop"]["game"]
-    game = NBAGame(**game_d)
+    game = _fast_new(NBAGame, dict(d["prop"]["game"]))
 
     prop_d = dict(d["prop"])
     prop_d["game"] = game
-    prop = PlayerProp(**prop_d)
-
-    factors = [FactorResult(**f) for f in d["factors"]]
-
-    return ValuedProp(
-        prop=prop,
-        value_score=d["value_score"],
-        factors=factors,
-        recommendation=d["recommendation"],
-        backing_data=d.get("backing_data", {}),
-        suspicious_line=d.get("suspicious_line", False),
-        suspicious_reason=d.get("suspicious_reason", ""),
-    )
+    prop = _fast_new(PlayerProp, prop_d)
+
+    return _fast_new(ValuedProp, {
+        "prop": prop,
+        "value_score": d["value_score"],
+        "factors": [_fast_new(FactorResult, dict(f)) for f in d["factors"]],
+        "recommendation": d["recommendation"],
+        "backing_data": d.get("backing_data", {}),
+        "suspicious_line": d.get("suspicious_line", False),
+        "suspicious_reason": d.get("suspicious_reason", ""),
+    })
 
 
 def _vp_to_response(vp: ValuedProp) -> dict:
@@ -580,22 +656,48 @@ def _slip_to_response(slip: BetSlip, odds_str: str) -> dict:
     }
 
 
+# Accepts fractional ("5/1"), american ("+400"/"-150") or decimal ("5.0")
+# odds in one pass — a single C-level match replaces the old chain of
+# startswith/split/strip branches and gives one validation point.
+_ODDS_RE = re.compile(r"^\s*([+-]?)(\d+(?:\.\d+)?)(?:/(\d+(?:\.\d+)?))?\s*$")
+
+
 def _parse_odds(odds_str: str) -> float:
-    odds_str = odds_str.strip()
-    if "/" in odds_str:
-        a, b = odds_str.split("/")
-        return round(float(a) / float(b) + 1, 4)
-    if odds_str.startswith("+"):
-        return round(float(odds_str[1:]) / 100 + 1, 4)
-    if odds_str.startswith("-"):
-        return round(100 / abs(float(odds_str)) + 1, 4)
-    val = float(odds_str)
+    m = _ODDS_RE.match(odds_str)
+    if not m:
+        raise ValueError(f"Unrecognised odds format: {odds_str!r}")
+    sign, num, denom = m.groups()
+    if denom is not None:
+        return round(float(num) / float(denom) + 1, 4)
+    if sign == "+":
+        return round(float(num) / 100 + 1, 4)
+    if sign == "-":
+        return round(100 / float(num) + 1, 4)
+    val = float(num)
     if val <= 1.0:
         raise ValueError(f"Decimal odds must be > 1.0, got {val}")
     return round(val, 4)
 
 
+# Reconstructed-ValuedProp cache keyed on the cache file's mtime — /api/slips
+# and /api/slips/save otherwise re-parse the JSON and rebuild thousands of
+# dataclasses on every request within the same refresh cycle.
+_vp_cache: tuple[float, list[ValuedProp]] | None = None
+_vp_cache_lock = threading.Lock()
+
+
 def _load_valued_props() -> list[ValuedProp]:
+    global _vp_cache
+    cache_path = cache._cache_path(f"scored_props_{date.today().isoformat()}")
+    try:
+        file_mtime = os.path.getmtime(cache_path)
+    except OSError:
+        file_mtime = None
+
+    with _vp_cache_lock:
+        if _vp_cache is not None and file_mtime is not None and _vp_cache[0] == file_mtime:
+            return _vp_cache[1]
+
     raw_dicts = cache.load_scored_props_raw()
     if not raw_dicts:
         return []
@@ -605,14 +707,54 @@ def _load_valued_props() -> list[ValuedProp]:
             result.append(_vp_from_dict(d))
         except Exception:
             pass
+
+    if file_mtime is not None:
+        with _vp_cache_lock:
+            _vp_cache = (file_mtime, result)
     return result
 
 
+def _props_cache_version() -> float:
+    """mtime of today's scored-props file — versions the memoized slip builds."""
+    try:
+        return os.path.getmtime(
+            cache._cache_path(f"scored_props_{date.today().isoformat()}")
+        )
+    except OSError:
+        return 0.0
+
+
+@functools.lru_cache(maxsize=32)
+def _build_slips_cached(
+    version: float,
+    target_decimal: Optional[float],
+    n_legs: Optional[int],
+    min_score: float,
+    bookmaker: Optional[str],
+) -> list[BetSlip]:
+    """Memoized combinatorial slip build.
+
+    /api/slips/save replays the exact parameters of the preceding /api/slips
+    call just to pick one slip by index — memoizing on (props-file mtime,
+    params) turns that rebuild into a dict hit. A new grade run changes the
+    mtime, so stale entries simply stop being referenced.
+    """
+    return bet_builder.build_slips(
+        _load_valued_props(),
+        target_decimal=target_decimal,
+        n_legs=n_legs,
+        min_score=min_score,
+        bookmaker=bookmaker,
+    )
+
+
 # ---------------------------------------------------------------------------
 # Pre-computed props response cache (avoids 1000+ DB queries per request)
 # ---------------------------------------------------------------------------
 _props_response_cache: list[dict] | None = None
 _props_cache_ts: float = 0.0
+_bookmakers_cache: list[str] = []
+_bookmakers_cache_ts: float = 0.0
 
 
 def _build_props_response() -> list[dict]:
@@ -621,7 +763,7 @@ def _build_props_response() -> list[dict]:
     This replaces per-prop DB lookups (1000+ individual queries) with a single
     batch query, and avoids re-deserializing the cache file on every request.
     """
-    global _props_response_cache, _props_cache_ts
+    global _props_response_cache, _props_cache_ts, _bookmakers_cache, _bookmakers_cache_ts
     raw_dicts = cache.load_scored_props_raw()
     if not raw_dicts:
         return []
@@ -636,52 +778,99 @@ def _build_props_response() -> list[dict]:
             continue
     id_lookup = database.get_all_graded_prop_ids(game_date) if game_date else {}
 
+    # Round every factor score in one NumPy pass instead of ~8 Python-level
+    # round() calls per prop inside the comprehension. One malformed factor
+    # dict must not poison the whole response, so fall back to per-prop
+    # rounding (inside the per-prop try below) if the bulk pass fails.
+    factor_counts = [len(d.get("factors") or []) for d in raw_dicts]
+    try:
+        rounded_scores = np.round(
+            np.fromiter(
+                (f["score"] for d in raw_dicts for f in (d.get("factors") or [])),
+                dtype=np.float64,
+                count=sum(factor_counts),
+            ),
+            1,
+        ).tolist()
+    except (KeyError, TypeError, ValueError):
+        rounded_scores = None
+
     result = []
-    for d in raw_dicts:
+    pos = 0
+    for d, n_factors in zip(raw_dicts, factor_counts):
         try:
-            vp = _vp_from_dict(d)
+            scores = (
+                rounded_scores[pos:pos + n_factors]
+                if rounded_scores is not None
+                else None
+            )
+            result.append(_vp_response_from_dict(d, id_lookup, scores))
         except Exception:
             continue
-        g = vp.prop.game
-        side = vp.backing_data.get("side", "over")
-        prop_id = id_lookup.get(
-            (vp.prop.player_name, vp.prop.market, vp.prop.line, side)
-        )
-        result.append({
-            "prop_id": prop_id,
-            "player_name": vp.prop.player_name,
-            "player_id": vp.prop.nba_player_id,
-            "market": vp.prop.market,
-            "market_label": config.get_market_label(vp.prop.market),
-            "line": vp.prop.line,
-            "side": side,
-            "over_odds": vp.prop.over_odds_decimal,
-            "bookmaker": vp.prop.bookmaker,
-            "is_paddy_power": vp.prop.is_paddy_power,
-            "value_score": round(vp.value_score, 1),
-            "recommendation": vp.recommendation,
-            "game": f"{g.away_team} @ {g.home_team}",
-            "game_date": g.game_date,
-            "suspicious_line": vp.suspicious_line,
-            "suspicious_reason": vp.suspicious_reason,
-            "factors": [
-                {
-                    "name": f.name,
-                    "score": round(f.score, 1),
-                    "weight": f.weight,
-                    "evidence": f.evidence,
-                    "confidence": f.confidence,
-                }
-                for f in vp.factors
-            ],
-            "backing_data": vp.backing_data,
-        })
+        finally:
+            pos += n_factors
 
     _props_response_cache = result
     _props_cache_ts = time.time()
+    # Derive the distinct-bookmaker list here so /api/bookmakers doesn't
+    # rescan every prop on each request
+    _bookmakers_cache = sorted({p["bookmaker"] for p in result if p["bookmaker"]})
+    _bookmakers_cache_ts = _props_cache_ts
     return result
 
 
+def _vp_response_from_dict(
+    d: dict, id_lookup: dict, factor_scores: list[float] | None = None
+) -> dict:
+    """Format one cached ValuedProp dict for /api/props.
+
+    Reads fields straight off the raw dict — read-only endpoints don't need
+    the NBAGame/PlayerProp/FactorResult dataclasses rebuilt just to pull the
+    same values back out. _vp_from_dict stays for build_slips, which does.
+    factor_scores carries pre-rounded scores from the bulk NumPy pass in
+    _build_props_response; when absent we round here.
+    """
+    factors = d.get("factors") or []
+    if factor_scores is None:
+        factor_scores = [round(f["score"], 1) for f in factors]
+    prop = d["prop"]
+    g = prop["game"]
+    backing = d.get("backing_data", {}) or {}
+    side = backing.get("side", "over")
+    prop_id = id_lookup.get(
+        (prop["player_name"], prop["market"], prop["line"], side)
+    )
+    return {
+        "prop_id": prop_id,
+        "player_name": prop["player_name"],
+        "player_id": prop["nba_player_id"],
+        "market": prop["market"],
+        "market_label": config.get_market_label(prop["market"]),
+        "line": prop["line"],
+        "side": side,
+        "over_odds": prop["over_odds_decimal"],
+        "bookmaker": prop["bookmaker"],
+        "is_paddy_power": prop.get("is_paddy_power", True),
+        "value_score": round(d["value_score"], 1),
+        "recommendation": d["recommendation"],
+        "game": f"{g['away_team']} @ {g['home_team']}",
+        "game_date": g["game_date"],
+        "suspicious_line": d.get("suspicious_line", False),
+        "suspicious_reason": d.get("suspicious_reason", ""),
+        "factors": [
+            {
+                "name": f["name"],
+                "score": score,
+                "weight": f["weight"],
+                "evidence": f["evidence"],
+                "confidence": f.get("confidence", 1.0),
+            }
+            for f, score in zip(factors, factor_scores)
+        ],
+        "backing_data": backing,
+    }
+
+
 def _get_props_response() -> list[dict]:
     """Return cached response or build it. Rebuilds if cache file is newer."""
     global _props_response_cache, _props_cache_ts
@@ -698,10 +887,15 @@ def _get_props_response() -> list[dict]:
 
 
 def invalidate_props_cache() -> None:
-    """Clear in-memory cache so next request rebuilds from disk."""
-    global _props_response_cache, _props_cache_ts
+    """Clear in-memory caches so next request rebuilds from disk."""
+    global _props_response_cache, _props_cache_ts, _bookmakers_cache, _bookmakers_cache_ts, _vp_cache
     _props_response_cache = None
     _props_cache_ts = 0.0
+    _bookmakers_cache = []
+    _bookmakers_cache_ts = 0.0
+    with _vp_cache_lock:
+        _vp_cache = None
+    _build_slips_cached.cache_clear()
 
 
 # ---------------------------------------------------------------------------
@@ -735,65 +929,101 @@ def get_props(
     bookmaker: Optional[str] = Query(default=None),
     market: Optional[str] = Query(default=None),
     side: Optional[str] = Query(default=None),
-) -> list[dict]:
+    limit: int = Query(default=500, ge=1),
+) -> ORJSONResponse:
     """All scored props for today, optionally filtered.
 
     Uses an in-memory cache to avoid re-deserializing 1500+ props and
     running 1000+ individual DB queries on every page load.
     """
     all_props = _get_props_response()
-    result = []
-    for p in all_props:
+
+    # Normalise filter strings once, not once per prop
+    game_u = game.upper() if game else None
+    player_l = player.lower() if player else None
+    market_n = market.replace(" ", "+").lower() if market else None
+    side_l = side.lower() if side else None
+    label_cache: dict[str, str] = {}
+
+    def _passes(p: dict) -> bool:
         if p["value_score"] < min_score:
-            continue
-        if game and game.upper() not in p["game"].upper():
-            continue
-        if player and player.lower() not in p["player_name"].lower():
-            continue
+            return False
+        if game_u and game_u not in p["game"].upper():
+            return False
+        if player_l and player_l not in p["player_name"].lower():
+            return False
         if bookmaker and p["bookmaker"] != bookmaker:
-            continue
-        if market:
+            return False
+        if market_n:
             ml = p["market_label"]
-            if market.replace(" ", "+").lower() != ml.replace(" ", "+").lower():
-                continue
-        if side and p.get("side", "over") != side.lower():
-            continue
-        result.append(p)
-
-    result.sort(key=lambda x: x["value_score"], reverse=True)
-    return result
+            norm = label_cache.get(ml)
+            if norm is None:
+                norm = label_cache[ml] = ml.replace(" ", "+").lower()
+            if market_n != norm:
+                return False
+        if side_l and p.get("side", "over") != side_l:
+            return False
+        return True
+
+    # Clients render the top N — a bounded heap is O(N log K) vs O(N log N)
+    # for a full sort of the filtered list. Returning ORJSONResponse directly
+    # skips FastAPI's per-item response validation and jsonable_encoder walk —
+    # orjson serialises the plain dicts in one C pass.
+    return ORJSONResponse(heapq.nlargest(
+        limit, (p for p in all_props if _passes(p)), key=lambda x: x["value_score"]
+    ))
 
 
 @app.get("/api/bookmakers")
 def get_bookmakers() -> list[str]:
-    """Distinct bookmakers present in today's cached props."""
-    all_props = _get_props_response()
-    books: set[str] = set()
-    for p in all_props:
-        if p.get("bookmaker"):
-            books.add(p["bookmaker"])
-    return sorted(books)
+    """Distinct bookmakers present in today's cached props.
+
+    On a cold cache this reads the two fields it needs straight off the raw
+    dicts rather than triggering the full response build (DB id lookup,
+    factor formatting) just to throw most of it away.
+    """
+    global _bookmakers_cache, _bookmakers_cache_ts
+    if _props_response_cache is not None:
+        _get_props_response()
+        return _bookmakers_cache
+    # Cold path: rebuild when the source cache file changes (e.g. a CLI
+    # refresh rewrote it) — same mtime staleness check as _get_props_response
+    cache_path = cache._cache_path(f"scored_props_{date.today().isoformat()}")
+    try:
+        file_mtime = os.path.getmtime(cache_path)
+    except OSError:
+        file_mtime = 0.0
+    if not _bookmakers_cache or file_mtime > _bookmakers_cache_ts:
+        raw_dicts = cache.load_scored_props_raw() or []
+        _bookmakers_cache = sorted({
+            d["prop"]["bookmaker"]
+            for d in raw_dicts
+            if d.get("prop", {}).get("bookmaker")
+        })
+        _bookmakers_cache_ts = file_mtime
+    return _bookmakers_cache
 
 
 @app.post("/api/refresh")
-def trigger_refresh(season: str = config.DEFAULT_SEASON, _admin: dict = Depends(require_admin)) -> dict:
-    """Kick off the full fetch + grade pipeline in a background thread."""
+def trigger_refresh(
+    background_tasks: BackgroundTasks,
+    season: str = config.DEFAULT_SEASON,
+    _admin: dict = Depends(require_admin),
+) -> dict:
+    """Kick off the full fetch + grade pipeline as a background task."""
     with _refresh_lock:
         if _refresh_state["running"]:
             return {"status": "already_running", "state": dict(_refresh_state)}
+        _swap_state("_refresh_state", running=True)
 
-    t = threading.Thread(
-        target=_run_refresh_background, args=(season,), daemon=True
-    )
-    t.start()
+    background_tasks.add_task(_run_refresh_background, season)
     return {"status": "started"}
 
 
 @app.get("/api/refresh/status")
 def refresh_status() -> dict:
-    """Current state of the background refresh."""
-    with _refresh_lock:
-        return dict(_refresh_state)
+    """Current state of the background refresh. Lock-free snapshot read."""
+    return dict(_refresh_state)
 
 
 @app.get("/api/slips")
@@ -802,7 +1032,7 @@ def get_slips(
     legs: Optional[int] = Query(default=None),
     min_score: Optional[float] = Query(default=None),
     bookmaker: Optional[str] = Query(default=None),
-) -> list[dict]:
+) -> ORJSONResponse:
     """Build bet slips from cached props — instant, no API calls.
     When odds is omitted (or empty), returns highest-confidence combos regardless of odds.
     """
@@ -819,16 +1049,11 @@ def get_slips(
         except (ValueError, ZeroDivisionError) as exc:
             raise HTTPException(status_code=400, detail=str(exc))
 
-    vps = _load_valued_props()
     threshold = min_score if min_score is not None else config.MIN_VALUE_SCORE
-    slips = bet_builder.build_slips(
-        vps,
-        target_decimal=target_decimal,
-        n_legs=legs,
-        min_score=threshold,
-        bookmaker=bookmaker,
+    slips = _build_slips_cached(
+        _props_cache_version(), target_decimal, legs, threshold, bookmaker
     )
-    return [_slip_to_response(s, odds or "Best Value") for s in slips]
+    return ORJSONResponse([_slip_to_response(s, odds or "Best Value") for s in slips])
 
 
 class SaveSlipRequest(BaseModel):
@@ -852,14 +1077,9 @@ def save_slip_endpoint(req: SaveSlipRequest, user: dict = Depends(require_user))
         except (ValueError, ZeroDivisionError) as exc:
             raise HTTPException(status_code=400, detail=str(exc))
 
-    vps = _load_valued_props()
     threshold = req.min_score if req.min_score is not None else config.MIN_VALUE_SCORE
-    slips = bet_builder.build_slips(
-        vps,
-        target_decimal=target_decimal,
-        n_legs=req.legs,
-        min_score=threshold,
-        bookmaker=req.bookmaker,
+    slips = _build_slips_cached(
+        _props_cache_version(), target_decimal, req.legs, threshold, req.bookmaker
     )
 
     if req.slip_index >= len(slips):
@@ -1010,6 +1230,7 @@ def get_prop_results_endpoint(
     min_score:   Optional[float] = Query(default=None),
     result:      Optional[str]   = Query(default=None),
     side:        Optional[str]   = Query(default=None),
+    bookmaker:   Optional[str]   = Query(default=None),
     picks_only:  bool            = Query(default=False),
     active_only: bool            = Query(default=False),
     graded_only: bool            = Query(default=True),
@@ -1025,6 +1246,7 @@ def get_prop_results_endpoint(
         min_score=min_score,
         result=result,
         side=side,
+        bookmaker=bookmaker,
         picks_only=picks_only,
         active_only=active_only,
         graded_only=graded_only,
@@ -1102,13 +1324,11 @@ def get_schedule() -> dict:
         })
 
     # Last refresh time from _refresh_state
-    with _refresh_lock:
-        last_refresh = _refresh_state.get("finished_at")
-        refresh_status_val = _refresh_state.get("status")
+    last_refresh = _refresh_state.get("finished_at")
+    refresh_status_val = _refresh_state.get("status")
 
     # Last grade time from _results_state
-    with _results_lock:
-        last_grade = _results_state.get("finished_at")
+    last_grade = _results_state.get("finished_at")
 
     return {
         "jobs": jobs,
@@ -1261,17 +1481,13 @@ def _select_optimal_alt_lines(
         if df is None or df.empty or len(df) < config.MIN_GAMES_PLAYED:
             continue
 
-        compute_fn = market_cfg["compute"]
-        stat_col = market_cfg["stat_key"] if callable(compute_fn) else compute_fn
+        stat_col = market_cfg["stat_key"]
 
         if stat_col not in df.columns:
             # For combo stats (PRA, PR, etc.) the column may need to be computed
-            if callable(compute_fn):
-                try:
-                    df[stat_col] = df.apply(compute_fn, axis=1)
-                except Exception:
-                    continue
-            else:
+            try:
+                df[stat_col] = config.compute_market_series(df, base_market)
+            except Exception:
                 continue
 
         last_10 = df[stat_col].head(10)
@@ -1306,34 +1522,31 @@ def _run_alt_refresh_background(season: str) -> None:
     3. Grade only those ~60-120 selected props (game logs already cached)
     4. Persist to DB
     """
-    global _alt_refresh_state
-
-    with _alt_refresh_lock:
-        _alt_refresh_state.update(
-            running=True,
-            started_at=datetime.utcnow().isoformat(),
-            finished_at=None,
-            status="running",
-            props_graded=0,
-            props_total=0,
-            error=None,
-        )
+    _swap_state(
+        "_alt_refresh_state",
+        running=True,
+        started_at=_now(),
+        finished_at=None,
+        status="running",
+        props_graded=0,
+        props_total=0,
+        error=None,
+    )
 
     try:
         if not cache.load_scored_props_raw():
-            with _alt_refresh_lock:
-                _alt_refresh_state.update(
-                    running=False,
-                    finished_at=datetime.utcnow().isoformat(),
-                    status="error",
-                    error="Run the main refresh first so player data is cached.",
-                )
+            _swap_state(
+                "_alt_refresh_state",
+                running=False,
+                finished_at=_now(),
+                status="error",
+                error="Run the main refresh first so player data is cached.",
+            )
             return
 
         games = nba_stats.get_todays_games(force_fresh=True)
         if not games:
-            with _alt_refresh_lock:
-                _alt_refresh_state.update(running=False, finished_at=datetime.utcnow().isoformat(), status="no_games")
+            _swap_state("_alt_refresh_state", running=False, finished_at=_now(), status="no_games")
             return
 
         injuries = injury_api.get_injury_report()
@@ -1343,19 +1556,22 @@ def _run_alt_refresh_background(season: str) -> None:
             if event_id:
                 game.odds_event_id = event_id
 
-        # 1. Fetch all alt props from Odds API
+        # 1. Fetch all alt props from Odds API concurrently, then resolve
+        #    player IDs in one batch (same pattern as the main refresh)
+        event_ids = [g.odds_event_id for g in games if g.odds_event_id]
+        with ThreadPoolExecutor(max_workers=8) as fetch_pool:
+            raw_by_event: dict[str, list[dict]] = dict(zip(
+                event_ids,
+                fetch_pool.map(odds_api.get_alternate_props_for_event, event_ids),
+            ))
+
+        player_id_map = _resolve_player_ids(raw_by_event)
+
         all_raw_props: list[PlayerProp] = []
         for game in games:
-            if not game.odds_event_id:
+            raw = raw_by_event.get(game.odds_event_id)
+            if raw is None:
                 continue
-            raw = odds_api.get_alternate_props_for_event(game.odds_event_id)
-            player_id_map: dict[str, int] = {}
-            for rp in raw:
-                name = rp["player_name"]
-                if name not in player_id_map:
-                    pid = nba_stats.get_player_id(name)
-                    if pid:
-                        player_id_map[name] = pid
             props = odds_api.build_player_props(raw, game, player_id_map)
             all_raw_props.extend(props)
 
@@ -1370,56 +1586,62 @@ def _run_alt_refresh_background(season: str) -> None:
         all_raw_props = deduped_alt
 
         if not all_raw_props:
-            with _alt_refresh_lock:
-                _alt_refresh_state.update(running=False, finished_at=datetime.utcnow().isoformat(), status="no_props")
+            _swap_state("_alt_refresh_state", running=False, finished_at=_now(), status="no_props")
             return
 
         # 2. Smart filter — pick ONE optimal line per (player, market)
         selected = _select_optimal_alt_lines(all_raw_props, season)
 
         if not selected:
-            with _alt_refresh_lock:
-                _alt_refresh_state.update(
-                    running=False,
-                    finished_at=datetime.utcnow().isoformat(),
-                    status="no_props",
-                    error=f"Found {len(all_raw_props)} alt props but none matched floor + odds criteria.",
-                )
+            _swap_state(
+                "_alt_refresh_state",
+                running=False,
+                finished_at=_now(),
+                status="no_props",
+                error=f"Found {len(all_raw_props)} alt props but none matched floor + odds criteria.",
+            )
             return
 
-        with _alt_refresh_lock:
-            _alt_refresh_state["props_total"] = len(selected)
+        _swap_state("_alt_refresh_state", props_total=len(selected))
 
-        # 3. Grade the selected props
+        # 3. Grade the selected props in parallel (game logs already cached)
         all_valued_props: list[ValuedProp] = []
-        for i, prop in enumerate(selected):
-            vp = prop_grader.grade_prop(prop, injuries, season=season, side="over")
-            if vp is not None:
-                all_valued_props.append(vp)
-            with _alt_refresh_lock:
-                _alt_refresh_state["props_graded"] = i + 1
+        with ThreadPoolExecutor(max_workers=config.GRADER_WORKERS) as grade_pool:
+            futures = [
+                grade_pool.submit(prop_grader.grade_prop, prop, injuries, season=season, side="over")
+                for prop in selected
+            ]
+            for done, fut in enumerate(as_completed(futures), 1):
+                try:
+                    vp = fut.result()
+                except Exception:
+                    vp = None
+                if vp is not None:
+                    all_valued_props.append(vp)
+                if done % 16 == 0 or done == len(selected):
+                    _swap_state("_alt_refresh_state", props_graded=done)
 
         # 4. Persist to DB
         game_date = games[0].game_date if games else None
         if game_date:
             database.upsert_graded_props(all_valued_props, game_date)
 
-        with _alt_refresh_lock:
-            _alt_refresh_state.update(
-                running=False,
-                finished_at=datetime.utcnow().isoformat(),
-                status="done",
-                props_graded=len(all_valued_props),
-            )
+        _swap_state(
+            "_alt_refresh_state",
+            running=False,
+            finished_at=_now(),
+            status="done",
+            props_graded=len(all_valued_props),
+        )
 
     except Exception as exc:
-        with _alt_refresh_lock:
-            _alt_refresh_state.update(
-                running=False,
-                finished_at=datetime.utcnow().isoformat(),
-                status="error",
-                error=str(exc),
-            )
+        _swap_state(
+            "_alt_refresh_state",
+            running=False,
+            finished_at=_now(),
+            status="error",
+            error=str(exc),
+        )
 
 
 def _factors_from_db_row(r: dict) -> list[FactorResult]:
@@ -1450,17 +1672,15 @@ def _run_ladder_build_background(season: str) -> None:
     Build ladder slips from already-graded alt props in the database.
     Does NOT fetch or grade — uses existing data.
     """
-    global _ladder_state
-
-    with _ladder_lock:
-        _ladder_state.update(
-            running=True,
-            started_at=datetime.utcnow().isoformat(),
-            finished_at=None,
-            status="running",
-            props_graded=0,
-            error=None,
-        )
+    _swap_state(
+        "_ladder_state",
+        running=True,
+        started_at=_now(),
+        finished_at=None,
+        status="running",
+        props_graded=0,
+        error=None,
+    )
 
     try:
         # Load graded alt props from DB
@@ -1471,13 +1691,13 @@ def _run_ladder_build_background(season: str) -> None:
             alt_filter="alt", graded_only=False,
         )
         if not rows:
-            with _ladder_lock:
-                _ladder_state.update(
-                    running=False,
-                    finished_at=datetime.utcnow().isoformat(),
-                    status="no_props",
-                    error="No graded alt props found. Run 'Refresh Alt Lines' first.",
-                )
+            _swap_state(
+                "_ladder_state",
+                running=False,
+                finished_at=_now(),
+                status="no_props",
+                error="No graded alt props found. Run 'Refresh Alt Lines' first.",
+            )
             return
 
         # Reconstruct ValuedProp objects from DB rows for bet_builder
@@ -1522,13 +1742,13 @@ def _run_ladder_build_background(season: str) -> None:
                 continue
 
         if not all_valued_props:
-            with _ladder_lock:
-                _ladder_state.update(
-                    running=False,
-                    finished_at=datetime.utcnow().isoformat(),
-                    status="no_props",
-                    error="Could not reconstruct alt props from DB.",
-                )
+            _swap_state(
+                "_ladder_state",
+                running=False,
+                finished_at=_now(),
+                status="no_props",
+                error="Could not reconstruct alt props from DB.",
+            )
             return
 
         # Build slips
@@ -1547,64 +1767,66 @@ def _run_ladder_build_background(season: str) -> None:
 
         cache.set("ladder_results", multi_slip_dicts)
 
-        with _ladder_lock:
-            _ladder_state.update(
-                running=False,
-                finished_at=datetime.utcnow().isoformat(),
-                status="done",
-                props_graded=len(all_valued_props),
-            )
+        _swap_state(
+            "_ladder_state",
+            running=False,
+            finished_at=_now(),
+            status="done",
+            props_graded=len(all_valued_props),
+        )
 
     except Exception as exc:
-        with _ladder_lock:
-            _ladder_state.update(
-                running=False,
-                finished_at=datetime.utcnow().isoformat(),
-                status="error",
-                error=str(exc),
-            )
+        _swap_state(
+            "_ladder_state",
+            running=False,
+            finished_at=_now(),
+            status="error",
+            error=str(exc),
+        )
 
 
 # --- Alt Lines Refresh endpoints ---
 
 @app.post("/api/alt-refresh")
-def trigger_alt_refresh(season: str = config.DEFAULT_SEASON, _admin: dict = Depends(require_admin)) -> dict:
+def trigger_alt_refresh(
+    background_tasks: BackgroundTasks,
+    season: str = config.DEFAULT_SEASON,
+    _admin: dict = Depends(require_admin),
+) -> dict:
     """Fetch and grade alt lines from the Odds API."""
     with _alt_refresh_lock:
         if _alt_refresh_state["running"]:
             return {"status": "already_running", "state": dict(_alt_refresh_state)}
+        _swap_state("_alt_refresh_state", running=True)
 
-    t = threading.Thread(target=_run_alt_refresh_background, args=(season,), daemon=True)
-    t.start()
+    background_tasks.add_task(_run_alt_refresh_background, season)
     return {"status": "started"}
 
 
 @app.get("/api/alt-refresh/status")
 def alt_refresh_status() -> dict:
-    """Current state of the alt lines refresh."""
-    with _alt_refresh_lock:
-        return dict(_alt_refresh_state)
+    """Current state of the alt lines refresh. Lock-free snapshot read."""
+    return dict(_alt_refresh_state)
 
 
 # --- Ladder Build endpoints ---
 
 @app.post("/api/ladder")
-def trigger_ladder(season: str = config.DEFAULT_SEASON) -> dict:
+def trigger_ladder(background_tasks: BackgroundTasks, season: str = config.DEFAULT_SEASON) -> dict:
     """Build ladder slips from already-graded alt props."""
     with _ladder_lock:
         if _ladder_state["running"]:
             return {"status": "already_running", "state": dict(_ladder_state)}
+        _swap_state("_ladder_state", running=True)
 
-    t = threading.Thread(target=_run_ladder_build_background, args=(season,), daemon=True)
-    t.start()
+    background_tasks.add_task(_run_ladder_build_background, season)
     return {"status": "started"}
 
 
 @app.get("/api/ladder/status")
 def ladder_status() -> dict:
-    """Current state of the ladder build."""
-    with _ladder_lock:
-        return dict(_ladder_state)
+    """Current state of the ladder build. Lock-free snapshot read."""
+    return dict(_ladder_state)
 
 
 @app.get("/api/ladder/results")
@@ -1640,65 +1862,63 @@ _results_lock = threading.Lock()
 
 def _run_results_background(game_date: str) -> None:
     """Fetch box scores for game_date and grade all unresolved saved prop legs."""
-    global _results_state
-
-    with _results_lock:
-        _results_state.update(
-            status="running",
-            game_date=game_date,
-            started_at=datetime.utcnow().isoformat(),
-            finished_at=None,
-            checked=0,
-            hit=0,
-            miss=0,
-            no_data=0,
-            slips_resolved=0,
-            error=None,
-        )
+    _swap_state(
+        "_results_state",
+        status="running",
+        game_date=game_date,
+        started_at=_now(),
+        finished_at=None,
+        checked=0,
+        hit=0,
+        miss=0,
+        no_data=0,
+        slips_resolved=0,
+        error=None,
+    )
 
     try:
         summary = results_checker.check_results_for_date(game_date)
-        with _results_lock:
-            _results_state.update(
-                status="done",
-                finished_at=datetime.utcnow().isoformat(),
-                checked=summary["checked"],
-                hit=summary["hit"],
-                miss=summary["miss"],
-                no_data=summary["no_data"],
-                slips_resolved=summary["slips_resolved"],
-                games_finished=summary.get("games_finished", 0),
-                games_in_progress=summary.get("games_in_progress", 0),
-                games_not_started=summary.get("games_not_started", 0),
-            )
+        _swap_state(
+            "_results_state",
+            status="done",
+            finished_at=_now(),
+            checked=summary["checked"],
+            hit=summary["hit"],
+            miss=summary["miss"],
+            no_data=summary["no_data"],
+            slips_resolved=summary["slips_resolved"],
+            games_finished=summary.get("games_finished", 0),
+            games_in_progress=summary.get("games_in_progress", 0),
+            games_not_started=summary.get("games_not_started", 0),
+        )
     except Exception as exc:
-        with _results_lock:
-            _results_state.update(
-                status="error",
-                finished_at=datetime.utcnow().isoformat(),
-                error=str(exc),
-            )
+        _swap_state(
+            "_results_state",
+            status="error",
+            finished_at=_now(),
+            error=str(exc),
+        )
 
 
 @app.post("/api/results/check")
-def trigger_results_check(game_date: str = Query(..., description="YYYY-MM-DD")) -> dict:
+def trigger_results_check(
+    background_tasks: BackgroundTasks,
+    game_date: str = Query(..., description="YYYY-MM-DD"),
+) -> dict:
     """Kick off background result checking for all saved prop legs on game_date."""
     with _results_lock:
         if _results_state["status"] == "running":
             return {"status": "already_running", "state": dict(_results_state)}
+        _swap_state("_results_state", status="running")
 
-    t = threading.Thread(
-        target=_run_results_background, args=(game_date,), daemon=True
-    )
-    t.start()
+    background_tasks.add_task(_run_results_background, game_date)
     return {"status": "started", "game_date": game_date}
 
 
 @app.get("/api/results/status")
 def results_check_status() -> dict:
-    """Current state of the background results-check job."""
-    with _results_lock:
-        return dict(_results_state)
+    """Current state of the background results-check job. Lock-free snapshot read."""
+    return dict(_results_state)
 
 
 # ---------------------------------------------------------------------------
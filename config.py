@@ -2,11 +2,41 @@
 Central configuration: weights, market mappings, thresholds, constants.
 All tunable parameters live here — nothing is hardcoded in modules.
 """
+import bisect
+import functools
 import os
 from datetime import date
+from enum import IntEnum
+from types import MappingProxyType
+
+import numpy as np
 from dotenv import load_dotenv
 
-load_dotenv(override=True)  # .env always wins over any pre-existing shell env vars
+
+@functools.lru_cache(maxsize=1)
+def _load_env() -> None:
+    """Parse .env exactly once per process — repeated load_dotenv calls
+    re-read and re-parse the file on every invocation otherwise."""
+    load_dotenv(override=True)  # .env always wins over any pre-existing shell env vars
+
+
+_ENV_CACHE: dict[str, str] = {}
+
+
+def get_env(key: str, default: str = "") -> str:
+    """Memoized environment lookup. Triggers the one-time .env parse."""
+    try:
+        return _ENV_CACHE[key]
+    except KeyError:
+        _load_env()
+        value = _ENV_CACHE[key] = os.getenv(key, default)
+        return value
+
+
+def clear_env_cache() -> None:
+    """Reset memoized env state so tests can swap .env contents."""
+    _ENV_CACHE.clear()
+    _load_env.cache_clear()
 
 
 # ---------------------------------------------------------------------------
@@ -15,11 +45,15 @@ load_dotenv(override=True)  # .env always wins over any pre-existing shell env v
 #   Oct / Nov / Dec  → season beginning this calendar year  (e.g. Oct 2025 → "2025-26")
 #   Jan – Sep        → season that started last calendar year (e.g. Feb 2026 → "2025-26")
 # ---------------------------------------------------------------------------
+@functools.lru_cache(maxsize=8)
 def _nba_season(year_offset: int = 0) -> str:
     """
     Return the NBA season string for the current (or offset) season.
     year_offset=0  → current season  (e.g. "2025-26")
     year_offset=-1 → previous season (e.g. "2024-25")
+
+    Memoized per offset — the answer only changes at the October rollover;
+    long-running processes can call _nba_season.cache_clear() to re-derive.
     """
     today = date.today()
     base = today.year if today.month >= 10 else today.year - 1
@@ -44,10 +78,10 @@ def is_playoffs() -> bool:
 # Set ODDS_API_KEYS="key1,key2,key3" or fall back to single ODDS_API_KEY
 # ---------------------------------------------------------------------------
 def _parse_api_keys() -> list[str]:
-    multi = os.getenv("ODDS_API_KEYS", "")
+    multi = get_env("ODDS_API_KEYS")
     if multi:
         return [k.strip() for k in multi.split(",") if k.strip()]
-    single = os.getenv("ODDS_API_KEY", "")
+    single = get_env("ODDS_API_KEY")
     return [single] if single else []
 
 ODDS_API_KEYS: list[str] = _parse_api_keys()
@@ -56,7 +90,11 @@ ODDS_API_KEY: str = ODDS_API_KEYS[0] if ODDS_API_KEYS else ""  # backwards compa
 # ---------------------------------------------------------------------------
 # Factor weights — must sum to 1.0
 # ---------------------------------------------------------------------------
-FACTOR_WEIGHTS: dict[str, float] = {
+# Config mappings are wrapped in MappingProxyType: read-only views that
+# prevent accidental mutation by consumers while keeping plain-dict lookup
+# speed (literal keys are interned by the compiler, so hot-path lookups hit
+# the pointer-compare fast path already).
+FACTOR_WEIGHTS = MappingProxyType({
     "consistency":       0.30,   # Floor/ceiling + recency-weighted hit rate + mean (+9.7pp signal)
     "opponent_defense":  0.15,   # Opposing team defensive quality + pace adjustment (+19.7pp signal)
     "vs_opponent":       0.12,   # Performance vs tonight's specific opponent (H2H) (+2.0pp)
@@ -66,20 +104,48 @@ FACTOR_WEIGHTS: dict[str, float] = {
     "volume_context":    0.07,   # Minutes trend + FGA/assist-rate, direction-aware
     "season_avg":        0.06,   # Current season averages vs the prop line (+8.0pp)
     "line_value":        0.00,   # Retired (absorbed into volume_context)
-}
+})
 
 assert abs(sum(FACTOR_WEIGHTS.values()) - 1.0) < 0.001, "Weights must sum to 1.0"
 
+
+class Factor(IntEnum):
+    """Positional index for each factor, matching FACTOR_WEIGHTS_ARR."""
+    CONSISTENCY      = 0
+    OPPONENT_DEFENSE = 1
+    VS_OPPONENT      = 2
+    HOME_AWAY        = 3
+    INJURY           = 4
+    BLOWOUT_RISK     = 5
+    VOLUME_CONTEXT   = 6
+    SEASON_AVG       = 7
+    LINE_VALUE       = 8
+
+
+# Structure-of-arrays view of the same weights: numeric code can compute a
+# weighted sum as one array dot (scores @ FACTOR_WEIGHTS_ARR) instead of a
+# dict lookup per factor. FACTOR_WEIGHTS above stays the canonical mapping —
+# this array is derived from it, so the two can never drift.
+FACTOR_WEIGHTS_ARR = np.array(
+    [FACTOR_WEIGHTS[f.name.lower()] for f in Factor], dtype=np.float32
+)
+
 # ---------------------------------------------------------------------------
 # Recency weights for last-N games (most recent first, sum = 1.0)
+# Materialized as a read-only ndarray so consumers can take vectorized
+# dot products over the last-10 window instead of Python-level multiplies
 # ---------------------------------------------------------------------------
-RECENCY_WEIGHTS_10: list[float] = [0.20, 0.18, 0.15, 0.12, 0.10, 0.08, 0.06, 0.04, 0.04, 0.03]
+RECENCY_WEIGHTS_10 = np.asarray(
+    [0.20, 0.18, 0.15, 0.12, 0.10, 0.08, 0.06, 0.04, 0.04, 0.03], dtype=np.float32
+)
+RECENCY_WEIGHTS_10.setflags(write=False)
+assert abs(float(RECENCY_WEIGHTS_10.sum()) - 1.0) < 1e-6, "Recency weights must sum to 1.0"
 
 # ---------------------------------------------------------------------------
 # Minimum sample sizes for confidence scoring
 # Below these thresholds the factor score is blended toward a neutral 50
 # ---------------------------------------------------------------------------
-MIN_SAMPLE: dict[str, int] = {
+MIN_SAMPLE = MappingProxyType({
     "consistency":       5,
     "opponent_defense":  1,    # always available (league-wide team stats)
     "vs_opponent":       4,
@@ -88,13 +154,13 @@ MIN_SAMPLE: dict[str, int] = {
     "season_avg":        10,
     "blowout_risk":      1,
     "line_value":        1,
-}
+})
 
 # ---------------------------------------------------------------------------
 # Context similarity weights
 # Used by context_filter to down-weight non-current-team games
 # ---------------------------------------------------------------------------
-CONTEXT_WEIGHTS = {
+CONTEXT_WEIGHTS = MappingProxyType({
     "current_team":          1.00,
     "previous_team":         0.15,   # Mid-season trade: use with care
     "vs_opponent_current":   1.00,
@@ -104,57 +170,73 @@ CONTEXT_WEIGHTS = {
     "home_tonight_away":     0.00,   # Excluded
     "b2b_tonight_b2b":       1.00,
     "normal_rest_b2b":       0.30,
-}
+})
 
 # Minimum current-team games before we stop using previous-team data at all
 MIN_CURRENT_TEAM_GAMES: int = 15
 
 # ---------------------------------------------------------------------------
 # Market → stat computation mapping
-# 'compute' is either a column name string or a lambda that takes a pandas row
+# 'stat_key' names the game-log column; combo markets also list the source
+# 'components' columns so compute_market_series() can derive the column with
+# one vectorized add instead of a per-row lambda via df.apply
 # ---------------------------------------------------------------------------
-MARKET_MAP: dict[str, dict] = {
+MARKET_MAP = MappingProxyType({
     "player_points": {
         "stat_key": "PTS",
-        "compute":  "PTS",
         "label":    "Points",
     },
     "player_assists": {
         "stat_key": "AST",
-        "compute":  "AST",
         "label":    "Assists",
     },
     "player_rebounds": {
         "stat_key": "REB",
-        "compute":  "REB",
         "label":    "Rebounds",
     },
     "player_threes": {
         "stat_key": "FG3M",
-        "compute":  "FG3M",
         "label":    "3-Pointers Made",
     },
     "player_points_rebounds_assists": {
-        "stat_key": "PRA",
-        "compute":  lambda row: row["PTS"] + row["REB"] + row["AST"],
-        "label":    "Pts+Reb+Ast",
+        "stat_key":   "PRA",
+        "components": ("PTS", "REB", "AST"),
+        "label":      "Pts+Reb+Ast",
     },
     "player_points_rebounds": {
-        "stat_key": "PR",
-        "compute":  lambda row: row["PTS"] + row["REB"],
-        "label":    "Pts+Reb",
+        "stat_key":   "PR",
+        "components": ("PTS", "REB"),
+        "label":      "Pts+Reb",
     },
     "player_points_assists": {
-        "stat_key": "PA",
-        "compute":  lambda row: row["PTS"] + row["AST"],
-        "label":    "Pts+Ast",
+        "stat_key":   "PA",
+        "components": ("PTS", "AST"),
+        "label":      "Pts+Ast",
     },
     "player_rebounds_assists": {
-        "stat_key": "RA",
-        "compute":  lambda row: row["REB"] + row["AST"],
-        "label":    "Reb+Ast",
+        "stat_key":   "RA",
+        "components": ("REB", "AST"),
+        "label":      "Reb+Ast",
     },
-}
+})
+
+
+def compute_market_series(df, market: str):
+    """Return the stat series for a market, deriving combo columns columnar.
+
+    Simple markets read their own column; combo markets sum the component
+    columns in one vectorized operation over all games.
+    """
+    spec = MARKET_MAP[get_base_market(market)]
+    components = spec.get("components")
+    if components:
+        return df[list(components)].sum(axis=1)
+    return df[spec["stat_key"]]
+
+# Flat market → label lookup. Response/display loops resolve a label per
+# prop (and per slip leg) — a single dict hit beats the nested
+# MARKET_MAP.get(market, {}).get("label", ...) chain and its throwaway dict.
+MARKET_LABEL = MappingProxyType({k: v["label"] for k, v in MARKET_MAP.items()})
 
 # ---------------------------------------------------------------------------
 # Value scoring thresholds
@@ -166,6 +248,17 @@ SCORE_LABELS: list[tuple[float, str]] = [
     (0.0,  "Poor Value"),
 ]
 
+# Ascending views of SCORE_LABELS for binary-search lookup — SCORE_LABELS
+# above stays the authoring format
+_SCORE_THRESH: list[float] = [t for t, _ in sorted(SCORE_LABELS)]
+_SCORE_LABEL: list[str] = [label for _, label in sorted(SCORE_LABELS)]
+
+
+def label_score(score: float) -> str:
+    """Label a value score via bisect over the ascending thresholds."""
+    idx = bisect.bisect_right(_SCORE_THRESH, score) - 1
+    return _SCORE_LABEL[max(idx, 0)]
+
 MIN_VALUE_SCORE: float = 50.0   # Props below this are excluded from slips
 
 # ---------------------------------------------------------------------------
@@ -227,10 +320,18 @@ ESPN_INJURY_URL: str = (
 
 NBA_API_SLEEP: float = 0.0         # no delay — 24h cache means most calls are instant hits
 
+# Thread-pool size for parallel prop grading — grading is I/O-bound
+# (stats/odds/injury lookups), so threads overlap the network waits
+GRADER_WORKERS: int = 8
+
+# Thread-pool size for the per-game props fetch (one Odds API round-trip
+# per game, all independent — N games in flight instead of 1)
+PROPS_FETCH_WORKERS: int = 8
+
 # ---------------------------------------------------------------------------
 # Cache TTLs (seconds)
 # ---------------------------------------------------------------------------
-CACHE_TTL: dict[str, int] = {
+CACHE_TTL = MappingProxyType({
     "games":        43200,    # 12 hours
     "game_log":     21600,    # 6 hours — ensures B2B games are picked up on next-day refresh
     "injuries":     2700,     # 45 minutes
@@ -240,10 +341,15 @@ CACHE_TTL: dict[str, int] = {
     "team_stats":   86400,    # 24 hours
     "h2h":          86400,    # 24 hours
     "player_team":  43200,    # 12 hours — shorter than game_log so trades are caught same-day
-}
+    "player_ids":   86400,    # 24 hours — resolved name→id map; also bounds negative entries
+})
+
+CACHE_DIR: str = get_env("CACHE_DIR", os.path.join(os.path.dirname(__file__), ".cache"))
+DATABASE_PATH: str = get_env("DATABASE_PATH", os.path.join(os.path.dirname(__file__), "pickaparlay.db"))
 
-CACHE_DIR: str = os.getenv("CACHE_DIR", os.path.join(os.path.dirname(__file__), ".cache"))
-DATABASE_PATH: str = os.getenv("DATABASE_PATH", os.path.join(os.path.dirname(__file__), "pickaparlay.db"))
+# Create the cache directory once at import so hot-path cache reads/writes
+# never have to re-check (os.makedirs is a stat syscall per call otherwise)
+os.makedirs(CACHE_DIR, exist_ok=True)
 
 # ---------------------------------------------------------------------------
 # Misc
@@ -301,6 +407,4 @@ def get_base_market(market: str) -> str:
 
 def get_market_label(market: str) -> str:
     """Get human-readable label for a market key, handling _alternate suffix."""
-    base = get_base_market(market)
-    cfg = MARKET_MAP.get(base)
-    return cfg["label"] if cfg else market
+    return MARKET_LABEL.get(get_base_market(market), market)
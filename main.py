@@ -16,8 +16,13 @@ Legacy (still works):
 """
 from __future__ import annotations
 
-import dataclasses
+import functools
+import heapq
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import attrgetter
+
 import click
 
 # Ensure src is importable
@@ -26,17 +31,29 @@ sys.path.insert(0, os.path.dirname(__file__))
 
 import config
 from src import display
-from src.api import nba_stats, injury_api, odds_api
-from src.analysis import prop_grader, bet_builder
 from src.models import NBAGame, PlayerProp, FactorResult, ValuedProp
 import src.cache as cache
 import src.database as database
 
+# C-implemented sort key — cheaper per call than a Python lambda
+_SCORE_KEY = attrgetter("value_score")
+
+# The API/analysis modules (nba_api, pandas, requests, …) are imported
+# lazily inside the functions that need them, so commands that never hit
+# the network — history, slips from cache — skip their import cost.
+
 
 # ---------------------------------------------------------------------------
 # Odds parser
 # ---------------------------------------------------------------------------
 
+# One compiled pattern covers all three formats: optional sign, a number,
+# and an optional /denominator — same approach as the backend's _parse_odds.
+# The number part also accepts a bare leading dot (".33/1").
+_ODDS_RE = re.compile(r"^\s*([+-]?)(\d+(?:\.\d+)?|\.\d+)(?:/(\d+(?:\.\d+)?|\.\d+))?\s*$")
+
+
+@functools.lru_cache(maxsize=256)
 def parse_odds(odds_str: str) -> float:
     """
     Accept multiple formats and return decimal odds:
@@ -45,67 +62,88 @@ def parse_odds(odds_str: str) -> float:
       "+400"  → 5.0
       "-110"  → 1.909
     """
-    odds_str = odds_str.strip()
+    m = _ODDS_RE.match(odds_str)
+    if not m:
+        raise click.BadParameter(f"Cannot parse odds: {odds_str}")
+    sign, num, denom = m.groups()
 
     # Fractional: "4/1" or "1.5/1" or ".33/1"
-    if "/" in odds_str:
-        parts = odds_str.split("/")
+    if denom is not None:
         try:
-            return round(float(parts[0]) / float(parts[1]) + 1, 4)
-        except (ValueError, ZeroDivisionError):
+            return round(float(num) / float(denom) + 1, 4)
+        except ZeroDivisionError:
             raise click.BadParameter(f"Invalid fractional odds: {odds_str}")
 
     # American: "+400" or "-110"
-    if odds_str.startswith("+") or (odds_str.startswith("-") and not odds_str[1:].replace(".", "").isdigit() is False):
-        try:
-            american = float(odds_str)
-            if american > 0:
-                return round(american / 100 + 1, 4)
-            else:
-                return round(100 / abs(american) + 1, 4)
-        except ValueError:
-            pass
+    if sign == "+":
+        return round(float(num) / 100 + 1, 4)
+    if sign == "-":
+        return round(100 / float(num) + 1, 4)
 
     # Decimal
-    try:
-        val = float(odds_str)
-        if val <= 1.0:
-            raise click.BadParameter(f"Decimal odds must be > 1.0, got {val}")
-        return round(val, 4)
-    except ValueError:
-        raise click.BadParameter(f"Cannot parse odds: {odds_str}")
+    val = float(num)
+    if val <= 1.0:
+        raise click.BadParameter(f"Decimal odds must be > 1.0, got {val}")
+    return round(val, 4)
 
 
 # ---------------------------------------------------------------------------
 # ValuedProp reconstruction (cache → objects)
 # ---------------------------------------------------------------------------
 
+def _fast_new(cls, d: dict):
+    """Build a dataclass instance without running its generated __init__.
+
+    Cache reconstruction builds thousands of instances per slips run;
+    assigning __dict__ directly skips the per-field __init__ machinery.
+    Safe because these dataclasses store state in __dict__ and the dicts
+    come from our own to_dict() output, so the keys match the fields.
+    """
+    obj = object.__new__(cls)
+    obj.__dict__ = d
+    return obj
+
+
 def _vp_from_dict(d: dict) -> ValuedProp:
-    """Reconstruct a ValuedProp from its dataclasses.asdict() representation."""
-    game_d = d["prop"]["game"]
-    game = NBAGame(**game_d)
+    """Reconstruct a ValuedProp from its to_dict() representation."""
+    game = _fast_new(NBAGame, dict(d["prop"]["game"]))
 
     prop_d = dict(d["prop"])
     prop_d["game"] = game
-    prop = PlayerProp(**prop_d)
-
-    factors = [FactorResult(**f) for f in d["factors"]]
-
-    return ValuedProp(
-        prop=prop,
-        value_score=d["value_score"],
-        factors=factors,
-        recommendation=d["recommendation"],
-        backing_data=d.get("backing_data", {}),
-        suspicious_line=d.get("suspicious_line", False),
-        suspicious_reason=d.get("suspicious_reason", ""),
-    )
+    prop = _fast_new(PlayerProp, prop_d)
+
+    return _fast_new(ValuedProp, {
+        "prop": prop,
+        "value_score": d["value_score"],
+        "factors": [_fast_new(FactorResult, dict(f)) for f in d["factors"]],
+        "recommendation": d["recommendation"],
+        "backing_data": d.get("backing_data", {}),
+        "suspicious_line": d.get("suspicious_line", False),
+        "suspicious_reason": d.get("suspicious_reason", ""),
+    })
 
 
 # ---------------------------------------------------------------------------
 # Shared pipeline (steps 1–5)
 # ---------------------------------------------------------------------------
 
+def _fetch_props_for_game(game) -> list[PlayerProp]:
+    """Fetch and build all props for one game. Runs on a worker thread —
+    odds_api shares a thread-safe Session, and get_player_id is a pure
+    lookup over the static player list."""
+    from src.api import nba_stats, odds_api   # already loaded by _run_pipeline
+
+    raw = odds_api.get_player_props_for_event(game.odds_event_id)
+    player_id_map: dict[str, int] = {}
+    for rp in raw:
+        name = rp["player_name"]
+        if name not in player_id_map:
+            pid = nba_stats.get_player_id(name)
+            if pid:
+                player_id_map[name] = pid
+    return odds_api.build_player_props(raw, game, player_id_map)
+
+
 def _run_pipeline(
     season: str,
     verbose: bool,
@@ -117,6 +155,9 @@ def _run_pipeline(
     all_valued_props contains ALL scored props regardless of min_score —
     callers are responsible for filtering.
     """
+    from src.api import nba_stats, injury_api, odds_api
+    from src.analysis import prop_grader
+
     with display.make_progress() as progress:
         task = progress.add_task("Fetching tonight's games...", total=None)
         games = nba_stats.get_todays_games()
@@ -144,19 +185,17 @@ def _run_pipeline(
 
         task = progress.add_task("Fetching player props...", total=len(games))
         all_raw_props: list = []
-        for game in games:
-            if game.odds_event_id:
-                raw = odds_api.get_player_props_for_event(game.odds_event_id)
-                player_id_map: dict[str, int] = {}
-                for rp in raw:
-                    name = rp["player_name"]
-                    if name not in player_id_map:
-                        pid = nba_stats.get_player_id(name)
-                        if pid:
-                            player_id_map[name] = pid
-                props = odds_api.build_player_props(raw, game, player_id_map)
-                all_raw_props.extend(props)
-            progress.advance(task)
+        # Per-game fetches are independent HTTP calls — issue them
+        # concurrently and advance the bar from the main thread only
+        # (rich Progress is not thread-safe for concurrent updates)
+        matched = [g for g in games if g.odds_event_id]
+        if len(matched) < len(games):
+            progress.advance(task, len(games) - len(matched))
+        with ThreadPoolExecutor(max_workers=config.PROPS_FETCH_WORKERS) as ex:
+            futures = [ex.submit(_fetch_props_for_game, g) for g in matched]
+            for fut in as_completed(futures):
+                all_raw_props.extend(fut.result())
+                progress.advance(task)
         progress.update(task, description=f"Props loaded ({len(all_raw_props)} candidates) ✓")
 
     if not all_raw_props:
@@ -171,28 +210,51 @@ def _run_pipeline(
     errors: list[str] = []
     skipped_no_data = 0
 
+    # One task per (prop, side) — UNDER only when a valid under price exists.
+    # Grading is I/O-bound (stats/odds/injury lookups), so a thread pool
+    # overlaps the network waits — same pattern as the backend refresh job.
+    tasks: list[tuple] = [(p, "over") for p in all_raw_props]
+    tasks += [
+        (p, "under")
+        for p in all_raw_props
+        if p.under_odds_decimal and p.under_odds_decimal > 1.0
+    ]
+
+    # Only format per-prop descriptions when someone can see them —
+    # redirected output still gets the bar's start/end states
+    _tty = display.console.is_terminal
+
     with display.make_progress() as progress:
-        task = progress.add_task("Grading props...", total=len(all_raw_props))
-        for i, prop in enumerate(all_raw_props, 1):
-            market_label = config.MARKET_MAP.get(prop.market, {}).get("label", prop.market)
-            progress.update(
-                task,
-                description=f"[{i}/{len(all_raw_props)}] {prop.player_name} — {market_label}",
-            )
-            try:
-                vp_over = prop_grader.grade_prop(prop, injuries, season=season, side="over")
-                if vp_over is None:
-                    skipped_no_data += 1
-                else:
-                    all_valued_props.append(vp_over)
-                    # Also grade UNDER if a valid under price exists
-                    if prop.under_odds_decimal and prop.under_odds_decimal > 1.0:
-                        vp_under = prop_grader.grade_prop(prop, injuries, season=season, side="under")
-                        if vp_under is not None:
-                            all_valued_props.append(vp_under)
-            except Exception as e:
-                errors.append(f"{prop.player_name} / {prop.market}: {type(e).__name__}: {e}")
-            progress.advance(task)
+        task = progress.add_task("Grading props...", total=len(tasks))
+        with ThreadPoolExecutor(max_workers=config.GRADER_WORKERS) as ex:
+            futures = {
+                ex.submit(prop_grader.grade_prop, p, injuries, season=season, side=s): (p, s)
+                for p, s in tasks
+            }
+            for done, fut in enumerate(as_completed(futures), 1):
+                prop, side = futures[fut]
+                try:
+                    vp = fut.result()
+                    if vp is None:
+                        # Count each prop once — the UNDER side fails the
+                        # same availability checks as the OVER side
+                        if side == "over":
+                            skipped_no_data += 1
+                    else:
+                        all_valued_props.append(vp)
+                except Exception as e:
+                    errors.append(f"{prop.player_name} / {prop.market}: {type(e).__name__}: {e}")
+                progress.advance(task)
+                # Refresh the description every 10 completions, not per
+                # prop — each update re-renders the whole bar
+                if _tty and (done % 10 == 0 or done == len(tasks)):
+                    progress.update(
+                        task,
+                        description=(
+                            f"[{done}/{len(tasks)}] "
+                            f"{prop.player_name} — {config.get_market_label(prop.market)}"
+                        ),
+                    )
         progress.update(task, description=f"Grading complete — {len(all_valued_props)} props scored ✓")
 
     display.console.print(
@@ -227,19 +289,26 @@ def _display_and_build_slips(
     verbose: bool,
 ) -> list:
     """Filter props, display table, build + display slips. Returns slip list."""
+    from src.analysis import bet_builder
+
     threshold = min_score if min_score is not None else config.MIN_VALUE_SCORE
-    eligible = [vp for vp in all_valued_props if vp.value_score >= threshold]
-    below = [vp for vp in all_valued_props if vp.value_score < threshold]
+    # Partition in one pass instead of scanning the list twice
+    eligible: list[ValuedProp] = []
+    below: list[ValuedProp] = []
+    for vp in all_valued_props:
+        (eligible if vp.value_score >= threshold else below).append(vp)
 
     if not eligible:
         if below:
-            below.sort(key=lambda v: v.value_score, reverse=True)
+            # Only the top 10 are shown — a bounded heap selection beats
+            # fully sorting the below-threshold list
+            top_below = heapq.nlargest(10, below, key=_SCORE_KEY)
             display.console.print(
                 f"[yellow]No props met the minimum score of {threshold}. "
-                f"Top {min(10, len(below))} below threshold:[/yellow]\n"
+                f"Top {len(top_below)} below threshold:[/yellow]\n"
             )
-            for vp in below[:10]:
-                ml = config.MARKET_MAP.get(vp.prop.market, {}).get("label", vp.prop.market)
+            for vp in top_below:
+                ml = config.get_market_label(vp.prop.market)
                 score_col = "yellow" if vp.value_score >= 40 else "red"
                 display.console.print(
                     f"  [{score_col}]{vp.value_score:.1f}/100[/{score_col}]  "
@@ -247,7 +316,7 @@ def _display_and_build_slips(
                     f"[dim]({vp.recommendation})[/dim]"
                 )
             display.console.print(
-                f"\n[dim]Tip: run with --min-score {max(10, int(below[0].value_score) - 5)} "
+                f"\n[dim]Tip: run with --min-score {max(10, int(top_below[0].value_score) - 5)} "
                 "to include the top-scoring props.[/dim]"
             )
         else:
@@ -262,7 +331,7 @@ def _display_and_build_slips(
         display.console.print()
         display.console.rule("[bold]Full Factor Breakdowns — Eligible Props[/bold]")
         for i, vp in enumerate(
-            sorted(eligible, key=lambda v: v.value_score, reverse=True), 1
+            sorted(eligible, key=_SCORE_KEY, reverse=True), 1
         ):
             display.print_valued_prop(vp, rank=i)
 
@@ -349,7 +418,6 @@ def cli(
         click.echo(ctx.get_help())
         return
 
-    database.init_db()
     display.print_header()
     display.print_credits()
 
@@ -418,8 +486,11 @@ def refresh_cmd(season: str, verbose: bool) -> None:
         return
 
     # Serialise ALL scored props to cache (threshold-agnostic)
-    prop_dicts = [dataclasses.asdict(vp) for vp in all_valued_props]
+    prop_dicts = [vp.to_dict() for vp in all_valued_props]
     cache.save_scored_props(prop_dicts)
+    # Binary twin of the same data — 'slips' loads this one and skips the
+    # dict→dataclass reconstruction entirely
+    cache.save_scored_props_bin(all_valued_props)
 
     above_threshold = sum(
         1 for vp in all_valued_props if vp.value_score >= config.MIN_VALUE_SCORE
@@ -512,7 +583,6 @@ def slips_cmd(
     Then call 'slips' as many times as you like with different odds targets
     without using any Odds API credits.
     """
-    database.init_db()
     display.print_header()
 
     try:
@@ -521,23 +591,25 @@ def slips_cmd(
         display.console.print(f"[red]Error: {e}[/red]")
         sys.exit(1)
 
-    # Load cached props
-    raw_dicts = cache.load_scored_props_raw()
-    if not raw_dicts:
-        display.console.print(
-            "[yellow]No cached props found for today. "
-            "Run [bold]python main.py refresh[/bold] first.[/yellow]"
-        )
-        sys.exit(1)
-
-    # Reconstruct ValuedProp objects
-    all_valued_props: list[ValuedProp] = []
+    # Load cached props — binary cache first (ready-made ValuedProps),
+    # falling back to the JSON cache + reconstruction for older refreshes
     failed = 0
-    for d in raw_dicts:
-        try:
-            all_valued_props.append(_vp_from_dict(d))
-        except Exception:
-            failed += 1
+    all_valued_props: list[ValuedProp] | None = cache.load_scored_props_bin()
+    if all_valued_props is None:
+        raw_dicts = cache.load_scored_props_raw()
+        if not raw_dicts:
+            display.console.print(
+                "[yellow]No cached props found for today. "
+                "Run [bold]python main.py refresh[/bold] first.[/yellow]"
+            )
+            sys.exit(1)
+
+        all_valued_props = []
+        for d in raw_dicts:
+            try:
+                all_valued_props.append(_vp_from_dict(d))
+            except Exception:
+                failed += 1
 
     display.console.print(
         f"[dim]Loaded {len(all_valued_props)} cached props from today"
@@ -599,12 +671,18 @@ def history_cmd(limit: int) -> None:
     database.init_db()
     display.print_header()
 
+    from itertools import chain
+
+    from rich.live import Live
     from rich.table import Table
     from rich import box as rich_box
 
-    slips_data = database.get_history(limit=limit)
+    # Stream rows straight from the DB cursor — the first slip renders
+    # without waiting for the whole history page to materialise
+    slips_iter = database.iter_history(limit=limit)
+    first = next(slips_iter, None)
 
-    if not slips_data:
+    if first is None:
         display.console.print(
             "[yellow]No saved slips yet. "
             "Use [bold]python main.py slips --odds 4/1 --save[/bold] to save a slip.[/yellow]"
@@ -625,28 +703,27 @@ def history_cmd(limit: int) -> None:
     table.add_column("Legs")
     table.add_column("Outcome", justify="center")
 
-    for s in slips_data:
-        outcome = s.get("outcome") or "—"
-        outcome_style = {
-            "WIN":  "bold green",
-            "LOSS": "bold red",
-            "VOID": "yellow",
-        }.get(outcome, "dim")
-
-        legs_text = _legs_summary(s.get("legs", []))
-
-        table.add_row(
-            str(s["id"]),
-            str(s.get("saved_at", ""))[:16],
-            s.get("target_odds_str") or f"{s.get('target_decimal', 0):.2f}",
-            f"{s.get('combined_odds', 0):.2f}",
-            f"{s.get('avg_value_score', 0):.1f}/100",
-            s.get("bookmaker_filter") or "any",
-            legs_text,
-            f"[{outcome_style}]{outcome}[/{outcome_style}]",
-        )
-
-    display.console.print(table)
+    with Live(table, console=display.console, refresh_per_second=4):
+        for s in chain([first], slips_iter):
+            outcome = s.get("outcome") or "—"
+            outcome_style = {
+                "WIN":  "bold green",
+                "LOSS": "bold red",
+                "VOID": "yellow",
+            }.get(outcome, "dim")
+
+            legs_text = _legs_summary(s.get("legs", []))
+
+            table.add_row(
+                str(s["id"]),
+                str(s.get("saved_at", ""))[:16],
+                s.get("target_odds_str") or f"{s.get('target_decimal', 0):.2f}",
+                f"{s.get('combined_odds', 0):.2f}",
+                f"{s.get('avg_value_score', 0):.1f}/100",
+                s.get("bookmaker_filter") or "any",
+                legs_text,
+                f"[{outcome_style}]{outcome}[/{outcome_style}]",
+            )
 
     # Aggregate analytics
     analytics = database.get_analytics()
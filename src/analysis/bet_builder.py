@@ -5,8 +5,9 @@ that land closest to the user's target odds.
 """
 from __future__ import annotations
 
+import heapq
 import math
-from itertools import combinations
+from dataclasses import dataclass
 
 import config
 from src.models import ValuedProp, BetLeg, BetSlip
@@ -47,21 +48,25 @@ def build_slips(
             valued_props = [vp for vp in valued_props if vp.prop.bookmaker == bookmaker.lower()]
 
     threshold = min_score if min_score is not None else config.MIN_VALUE_SCORE
-    eligible = [vp for vp in valued_props if vp.value_score >= threshold]
-    eligible.sort(key=lambda vp: vp.value_score, reverse=True)
-
-    # Cap search space
-    eligible = eligible[: config.MAX_PROPS_IN_SEARCH]
+    # Cap search space — bounded top-K selection instead of sorting the
+    # whole list just to slice it (O(N log K), no second N-sized copy)
+    eligible = heapq.nlargest(
+        config.MAX_PROPS_IN_SEARCH,
+        (vp for vp in valued_props if vp.value_score >= threshold),
+        key=lambda vp: vp.value_score,
+    )
 
     if not eligible:
         return []
 
+    soa = _to_soa(eligible)   # one snapshot shared by every leg count
+
     if force_leg_counts is not None:
         leg_counts = force_leg_counts
     elif n_legs is not None:
         leg_counts = [n_legs]
     elif target_decimal is not None:
-        leg_counts = _estimate_leg_counts(eligible, target_decimal)
+        leg_counts = _estimate_leg_counts(soa.odds, target_decimal)
     else:
         leg_counts = [3, 4, 5]   # best-value mode: one of each size for variety
 
@@ -74,18 +79,23 @@ def build_slips(
             continue
         slips = _search_combinations(
             eligible, target_decimal, n,
-            tolerance=tolerance, player_limit=player_limit,
+            tolerance=tolerance, player_limit=player_limit, soa=soa,
         )
         all_slips.extend(slips)
 
-    # Deduplicate by frozenset of (player, market, side) tuples
+    # Deduplicate on (player, market, side) — packed into one small int
+    # per leg from the SoA codes, so key building hashes ints instead of
+    # allocating and hashing three strings per leg. Keyed by id() because
+    # every leg's ValuedProp is one of the `eligible` objects (and plain
+    # dataclasses aren't hashable).
+    code_by_vp = {
+        id(vp): (soa.pids[i] << 20) | (soa.market_ids[i] << 4) | soa.side_bits[i]
+        for i, vp in enumerate(eligible)
+    }
     seen_keys: set[frozenset] = set()
     unique_slips: list[BetSlip] = []
     for slip in sorted(all_slips, key=lambda s: s.total_value_score, reverse=True):
-        key = frozenset(
-            (leg.valued_prop.prop.player_name, leg.valued_prop.prop.market, leg.side)
-            for leg in slip.legs
-        )
+        key = frozenset(code_by_vp[id(leg.valued_prop)] for leg in slip.legs)
         if key not in seen_keys:
             seen_keys.add(key)
             unique_slips.append(slip)
@@ -96,14 +106,6 @@ def build_slips(
     return _diverse_select(unique_slips, leg_counts, config.MAX_SLIPS_RETURNED)
 
 
-def _prop_decimal_odds(vp: ValuedProp) -> float:
-    """Return the correct decimal odds for this prop based on its graded side."""
-    side = vp.backing_data.get("side", "over")
-    if side == "under" and vp.prop.under_odds_decimal and vp.prop.under_odds_decimal > 1.0:
-        return vp.prop.under_odds_decimal
-    return vp.prop.over_odds_decimal
-
-
 def _slip_player_set(slip: BetSlip) -> set[str]:
     """Return the set of player names in a slip (for overlap checks)."""
     return {leg.valued_prop.prop.player_name for leg in slip.legs}
@@ -171,12 +173,17 @@ def _diverse_select(
     return selected[:max_return]
 
 
-def _estimate_leg_counts(eligible: list[ValuedProp], target_decimal: float) -> list[int]:
-    """Estimate how many legs needed to reach target_decimal."""
-    if not eligible:
+def _estimate_leg_counts(odds: list[float], target_decimal: float) -> list[int]:
+    """Estimate how many legs needed to reach target_decimal.
+
+    Takes the SoA decimal-odds list so the average is one C-level sum
+    over floats already computed for the search, not another attribute
+    walk over the props.
+    """
+    if not odds:
         return [3]
 
-    avg_odds = sum(_prop_decimal_odds(vp) for vp in eligible) / len(eligible)
+    avg_odds = sum(odds) / len(odds)
     if avg_odds <= 1.0:
         return [3, 4]
 
@@ -199,24 +206,77 @@ _MARKET_COMPONENTS: dict[str, set[str]] = {
     "player_rebounds_assists": {"player_rebounds", "player_assists"},
 }
 
-
-def _has_overlapping_markets(combo: tuple[ValuedProp, ...]) -> bool:
-    """
-    Return True if any player appears with both a combo market and one of its component markets.
-    e.g. Player X has PRA + PTS → invalid (PTS is a component of PRA).
+# Bit per market involved in a combo/component relationship, plus a conflict
+# mask per market (a combo conflicts with its components and vice versa).
+# Turns the per-leg conflict check in the DFS into a single bitwise AND
+# against the player's accumulated market mask — markets outside the map
+# get bit 0 / mask 0 and can never conflict.
+_MARKET_BITS: dict[str, int] = {}
+_CONFLICT_MASK: dict[str, int] = {}
+for _combo, _components in _MARKET_COMPONENTS.items():
+    for _mkt in (_combo, *_components):
+        if _mkt not in _MARKET_BITS:
+            _MARKET_BITS[_mkt] = 1 << len(_MARKET_BITS)
+    _CONFLICT_MASK[_combo] = _CONFLICT_MASK.get(_combo, 0)
+    for _mkt in _components:
+        _CONFLICT_MASK[_combo] |= _MARKET_BITS[_mkt]
+        _CONFLICT_MASK[_mkt] = _CONFLICT_MASK.get(_mkt, 0) | _MARKET_BITS[_combo]
+del _combo, _components, _mkt
+
+_OVER_BIT = 1
+_UNDER_BIT = 2
+
+
+@dataclass(frozen=True)
+class _PropsSoA:
+    """Struct-of-arrays snapshot of the eligible props.
+
+    The DFS reads these flat parallel lists instead of chasing
+    vp.prop.* attributes per visit — every string (player, market,
+    side, game id) is interned to a small int up front, so the hot
+    loop is pure index/bit arithmetic on native ints and floats.
     """
-    # Group markets by player
-    player_markets: dict[str, set[str]] = {}
-    for vp in combo:
-        name = vp.prop.player_name
-        market = vp.prop.market
-        player_markets.setdefault(name, set()).add(market)
-
-    for name, markets in player_markets.items():
-        for combo_market, components in _MARKET_COMPONENTS.items():
-            if combo_market in markets and markets & components:
-                return True
-    return False
+    odds: list[float]            # graded-side decimal odds
+    scores: list[float]          # value scores
+    pids: list[int]              # interned player ids
+    n_players: int
+    market_ids: list[int]        # interned market ids
+    n_markets: int
+    market_bits: list[int]       # combo-conflict bit per prop (0 = none)
+    conflict_masks: list[int]    # markets this prop's market conflicts with
+    side_bits: list[int]         # _OVER_BIT or _UNDER_BIT
+    game_codes: list[int]        # interned game ids
+
+
+def _to_soa(eligible: list[ValuedProp]) -> _PropsSoA:
+    """Build the SoA snapshot once; shared across all searched leg counts."""
+    pid_by_name: dict[str, int] = {}
+    mid_by_market: dict[str, int] = {}
+    code_by_game: dict[str, int] = {}
+    return _PropsSoA(
+        odds=[vp.decimal_odds for vp in eligible],
+        scores=[vp.value_score for vp in eligible],
+        pids=[
+            pid_by_name.setdefault(vp.prop.player_name, len(pid_by_name))
+            for vp in eligible
+        ],
+        n_players=len({vp.prop.player_name for vp in eligible}),
+        market_ids=[
+            mid_by_market.setdefault(vp.prop.market, len(mid_by_market))
+            for vp in eligible
+        ],
+        n_markets=len({vp.prop.market for vp in eligible}),
+        market_bits=[_MARKET_BITS.get(vp.prop.market, 0) for vp in eligible],
+        conflict_masks=[_CONFLICT_MASK.get(vp.prop.market, 0) for vp in eligible],
+        side_bits=[
+            _UNDER_BIT if vp.backing_data.get("side", "over") == "under" else _OVER_BIT
+            for vp in eligible
+        ],
+        game_codes=[
+            code_by_game.setdefault(vp.prop.game.game_id, len(code_by_game))
+            for vp in eligible
+        ],
+    )
 
 
 def _search_combinations(
@@ -225,51 +285,154 @@ def _search_combinations(
     n: int,
     tolerance: float | None = None,
     player_limit: int = 2,
+    soa: _PropsSoA | None = None,
 ) -> list[BetSlip]:
-    """Generate all N-leg combinations and score them."""
+    """Score all valid N-leg combinations via a pruned depth-first search.
+
+    Visits combinations in the same order as itertools.combinations and
+    keeps identical acceptance rules, but cuts whole subtrees early:
+    player-limit / over+under / combo-market violations are rejected as
+    soon as a prefix contains them, and (when a target is set) a branch
+    is dropped once the best- or worst-case product of the remaining
+    legs can no longer land inside the odds tolerance window. For 40
+    props choose 5 this skips the vast majority of the C(40,5) tuples
+    the brute-force enumeration had to materialise and filter.
+    """
     tol = tolerance if tolerance is not None else config.ODDS_TOLERANCE
-    results: list[tuple[float, BetSlip]] = []
-
-    for combo in combinations(eligible, n):
-        # Constraint: max player_limit props per player (but not OVER+UNDER same market)
-        player_counts: dict[str, int] = {}
-        player_market_sides: dict[tuple, set] = {}
-        skip = False
-        for vp in combo:
-            name = vp.prop.player_name
-            player_counts[name] = player_counts.get(name, 0) + 1
-            # Track (player, market) → set of sides; reject if same player has OVER+UNDER same market
-            key = (name, vp.prop.market)
-            sides = player_market_sides.setdefault(key, set())
-            sides.add(vp.backing_data.get("side", "over"))
-            if len(sides) > 1:  # both over and under on same market for same player
-                skip = True
-                break
-        if skip or any(c > player_limit for c in player_counts.values()):
-            continue
 
-        # Constraint: no combo market + component market for the same player
-        if _has_overlapping_markets(combo):
-            continue
+    m = len(eligible)
+    if m < n:
+        return []
 
-        combined_odds = 1.0
-        for vp in combo:
-            combined_odds *= _prop_decimal_odds(vp)
+    if soa is None:
+        soa = _to_soa(eligible)
+    odds = soa.odds
+    scores = soa.scores
+    pids = soa.pids
+    market_ids = soa.market_ids
+    n_markets = soa.n_markets
+    market_bits = soa.market_bits
+    conflict_masks = soa.conflict_masks
+    side_bits = soa.side_bits
+    game_codes = soa.game_codes
+
+    lo = hi = 0.0
+    max_prod: list[list[float]] = []
+    min_prod: list[list[float]] = []
+    if target_decimal is not None:
+        lo = target_decimal * (1 - tol)
+        hi = target_decimal * (1 + tol)
+        # max_prod[i][r] / min_prod[i][r]: largest / smallest product of
+        # r odds drawn from odds[i:] — the reachability bounds for a
+        # branch standing at index i with r legs still to pick
+        for i in range(m + 1):
+            tail = sorted(odds[i:])
+            row_max = [1.0] * (n + 1)
+            row_min = [1.0] * (n + 1)
+            for r in range(1, n + 1):
+                if r <= len(tail):
+                    row_max[r] = math.prod(tail[-r:])
+                    row_min[r] = math.prod(tail[:r])
+                else:   # not enough props left — unreachable either way
+                    row_max[r] = 0.0
+                    row_min[r] = math.inf
+            max_prod.append(row_max)
+            min_prod.append(row_min)
+
+    # Accepted combos go through a bounded min-heap of (score, -seq, indices)
+    # so the search never materialises more than top-K candidates; BetSlip
+    # objects (legs, summary strings) are only built for the survivors.
+    # -seq keeps ties ordered by visit order, matching the old stable sort.
+    topk = config.MAX_SLIPS_RETURNED * 2
+    heap: list[tuple[float, int, tuple[int, ...]]] = []
+    seq = 0
+
+    chosen: list[int] = []
+    player_counts = [0] * soa.n_players
+    player_mask = [0] * soa.n_players
+    # Side bits taken per (player, market), flat-indexed — no tuple hashing
+    side_state = [0] * (soa.n_players * n_markets)
+
+    def dfs(start: int, running: float) -> None:
+        nonlocal seq
+        remaining = n - len(chosen)
+        if remaining == 0:
+            # Numeric scoring only — mirrors _score_slip without the slip:
+            # with target: avg_value*0.5 + proximity*0.3 + independence*0.2
+            # best-value:  avg_value*0.75 + independence*0.25
+            if target_decimal is not None:
+                proximity = abs(running - target_decimal) / target_decimal
+                if proximity > tol:
+                    return
+                proximity_score = max(0.0, 1.0 - proximity / config.ODDS_TOLERANCE)
+            avg_value = round(sum(scores[j] for j in chosen) / n, 1) / 100
+            independence = 1.0 if len({game_codes[j] for j in chosen}) == n else 0.8
+            if target_decimal is None:
+                slip_score = avg_value * 0.75 + independence * 0.25
+            else:
+                slip_score = avg_value * 0.5 + proximity_score * 0.3 + independence * 0.2
+
+            entry = (slip_score, -seq, tuple(chosen))
+            seq += 1
+            if len(heap) < topk:
+                heapq.heappush(heap, entry)
+            elif entry > heap[0]:
+                heapq.heapreplace(heap, entry)
+            return
+
+        for i in range(start, m):
+            if m - i < remaining:
+                break
+            pid = pids[i]
 
-        # Odds proximity filter — skipped in best-value mode (target_decimal is None)
-        if target_decimal is not None:
-            proximity = abs(combined_odds - target_decimal) / target_decimal
-            if proximity > tol:
+            # Constraint: max player_limit props per player
+            if player_counts[pid] >= player_limit:
                 continue
-        else:
-            proximity = None
+            # Constraint: no OVER+UNDER of the same market for one player
+            slot = pid * n_markets + market_ids[i]
+            sbit = side_bits[i]
+            taken = side_state[slot]
+            if taken and not taken & sbit:
+                continue
+            # Constraint: no combo market + component market per player —
+            # one AND against the player's accumulated market bitmask
+            if player_mask[pid] & conflict_masks[i]:
+                continue
+
+            next_running = running * odds[i]
+            if target_decimal is not None:
+                r = remaining - 1
+                # Prune: even the extreme products of the remaining legs
+                # can't bring this branch inside [lo, hi]
+                if next_running * max_prod[i + 1][r] < lo:
+                    continue
+                if next_running * min_prod[i + 1][r] > hi:
+                    continue
+
+            bit = market_bits[i]
+            added_bit = bit & ~player_mask[pid]
+            added_side = sbit & ~taken
+
+            chosen.append(i)
+            player_counts[pid] += 1
+            side_state[slot] = taken | sbit
+            player_mask[pid] |= bit
 
-        slip = _make_slip(list(combo), combined_odds, target_decimal)
-        slip_score = _score_slip(slip, proximity)
-        results.append((slip_score, slip))
+            dfs(i + 1, next_running)
 
-    results.sort(key=lambda x: x[0], reverse=True)
-    return [slip for _, slip in results[: config.MAX_SLIPS_RETURNED * 2]]
+            chosen.pop()
+            player_counts[pid] -= 1
+            side_state[slot] ^= added_side
+            player_mask[pid] ^= added_bit
+
+    dfs(0, 1.0)
+
+    slips: list[BetSlip] = []
+    for _, _, idxs in sorted(heap, reverse=True):
+        combo = [eligible[j] for j in idxs]
+        combined = math.prod(odds[j] for j in idxs)
+        slips.append(_make_slip(combo, combined, target_decimal))
+    return slips
 
 
 def _make_slip(
@@ -281,7 +444,7 @@ def _make_slip(
         BetLeg(
             valued_prop=vp,
             side=vp.backing_data.get("side", "over"),
-            decimal_odds=_prop_decimal_odds(vp),
+            decimal_odds=vp.decimal_odds,
         )
         for vp in combo
     ]
@@ -301,23 +464,6 @@ def _make_slip(
     )
 
 
-def _score_slip(slip: BetSlip, odds_proximity: float | None) -> float:
-    """
-    With target: slip_score = avg_value * 0.5 + proximity_score * 0.3 + independence * 0.2
-    Best-value mode (proximity=None): slip_score = avg_value * 0.75 + independence * 0.25
-    """
-    avg_value = slip.total_value_score / 100
-    independence = 0.8 if slip.has_correlated_legs else 1.0
-
-    if odds_proximity is None:
-        # Best-value mode: no odds constraint, pure quality signal
-        return avg_value * 0.75 + independence * 0.25
-
-    # proximity_score: 1.0 = exact match, 0.0 = at tolerance boundary
-    proximity_score = max(0.0, 1.0 - odds_proximity / config.ODDS_TOLERANCE)
-    return avg_value * 0.5 + proximity_score * 0.3 + independence * 0.2
-
-
 def _has_correlated_legs(legs: list[BetLeg]) -> bool:
     """True if 2+ legs are from the same game."""
     game_ids = [leg.valued_prop.prop.game.game_id for leg in legs]
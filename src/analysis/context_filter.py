@@ -15,10 +15,16 @@ multiply into their calculations.
 """
 from __future__ import annotations
 
+import re
+
+import numpy as np
 import pandas as pd
 
 import config
 
+# Compiled once — runs against every row of every game log
+_MATCHUP_SEP_RE = re.compile(r" vs\. | @ ")
+
 
 def apply_context_weights(
     df: pd.DataFrame,
@@ -32,6 +38,10 @@ def apply_context_weights(
 
     Applies team-transfer weighting and B2B weighting only.
     Home/away filtering is handled per-factor, not here.
+
+    Copy discipline: this is the only place that copies. The private
+    helpers below mutate the frame they're given in place — callers own
+    the copy.
     """
     if current_season is None:
         current_season = config.DEFAULT_SEASON
@@ -51,7 +61,7 @@ def apply_context_weights(
 
 
 def _team_from_matchup(matchup: str) -> str:
-    """Extract the player's team abbreviation from a MATCHUP string.
+    """Extract the player's team abbreviation from a single MATCHUP string.
     MATCHUP format: 'TOR vs. SAS' (home) or 'TOR @ SAS' (away).
     The first token is always the player's team.
     """
@@ -61,6 +71,18 @@ def _team_from_matchup(matchup: str) -> str:
     return matchup[:3].upper()
 
 
+def _team_vec(matchups: pd.Series) -> pd.Series:
+    """Vectorised _team_from_matchup for a whole MATCHUP column — one
+    C-level split/strip/upper pass instead of a Python call per row."""
+    return (
+        matchups.str.split(_MATCHUP_SEP_RE, n=1)
+        .str[0]
+        .str.strip()
+        .str[:3]
+        .str.upper()
+    )
+
+
 def _apply_team_weights(
     df: pd.DataFrame,
     current_team_abbr: str,
@@ -75,7 +97,7 @@ def _apply_team_weights(
         df["CTX_WEIGHT"] = 1.0
         return df
 
-    player_teams = df["MATCHUP"].apply(_team_from_matchup)
+    player_teams = _team_vec(df["MATCHUP"])
     current_mask = player_teams == current_team_abbr.upper()
     current_count = current_mask.sum()
 
@@ -102,12 +124,13 @@ def _apply_home_away_weights(df: pd.DataFrame, tonight_is_home: bool) -> pd.Data
     if "MATCHUP" not in df.columns:
         return df
 
+    # MATCHUP is always "XXX vs. YYY" (home) or "XXX @ YYY" (away), so a
+    # literal substring check suffices — regex=False takes pandas' C
+    # str.find path instead of invoking the regex engine per row
     if tonight_is_home:
-        # Home games have "vs." in matchup string
-        location_mask = df["MATCHUP"].str.contains(r"\bvs\.", case=False, na=False)
+        location_mask = df["MATCHUP"].str.contains(" vs. ", regex=False, na=False)
     else:
-        # Away games have " @ " in matchup string
-        location_mask = df["MATCHUP"].str.contains(r"\s@\s", case=False, na=False)
+        location_mask = df["MATCHUP"].str.contains(" @ ", regex=False, na=False)
 
     df.loc[~location_mask, "CTX_WEIGHT"] = 0.0
     return df
@@ -117,30 +140,28 @@ def _apply_b2b_weights(df: pd.DataFrame) -> pd.DataFrame:
     """
     When tonight is a back-to-back, down-weight non-B2B historical games.
     We detect B2B games by looking at consecutive game dates.
+
+    Mutates in place — the caller owns the copy.
     """
     if "GAME_DATE" not in df.columns:
         return df
 
-    df = df.copy()
-    df["GAME_DATE"] = pd.to_datetime(df["GAME_DATE"], format="mixed")
+    if not pd.api.types.is_datetime64_any_dtype(df["GAME_DATE"]):
+        df["GAME_DATE"] = pd.to_datetime(df["GAME_DATE"], format="mixed", cache=True)
     df = df.sort_values("GAME_DATE", ascending=False).reset_index(drop=True)
 
-    # Mark each row as B2B or not based on gap to next game
-    is_b2b = []
-    dates = df["GAME_DATE"].tolist()
-    for i, date in enumerate(dates):
-        if i < len(dates) - 1:
-            gap = abs((dates[i] - dates[i + 1]).days)
-            is_b2b.append(gap == 1)
-        else:
-            is_b2b.append(False)
-
-    df["IS_B2B_GAME"] = is_b2b
+    # Mark each row as B2B based on the gap to the next (older) game —
+    # one vectorized datetime diff instead of a per-row Python loop
+    b2b_mask = df["GAME_DATE"].diff(-1).dt.days.abs().eq(1).fillna(False)
+    df["IS_B2B_GAME"] = b2b_mask
 
     # Down-weight non-B2B games when tonight is B2B
-    b2b_mask = df["IS_B2B_GAME"]
-    df.loc[b2b_mask, "CTX_WEIGHT"] = df.loc[b2b_mask, "CTX_WEIGHT"] * config.CONTEXT_WEIGHTS["b2b_tonight_b2b"]
-    df.loc[~b2b_mask, "CTX_WEIGHT"] = df.loc[~b2b_mask, "CTX_WEIGHT"] * config.CONTEXT_WEIGHTS["normal_rest_b2b"]
+    df["CTX_WEIGHT"] = df["CTX_WEIGHT"] * b2b_mask.map(
+        {
+            True: config.CONTEXT_WEIGHTS["b2b_tonight_b2b"],
+            False: config.CONTEXT_WEIGHTS["normal_rest_b2b"],
+        }
+    )
 
     return df
 
@@ -174,7 +195,7 @@ def filter_vs_opponent(
         return h2h
 
     # Apply team context to H2H slice — use MATCHUP, not TEAM_ABBREVIATION
-    player_teams = h2h["MATCHUP"].apply(_team_from_matchup)
+    player_teams = _team_vec(h2h["MATCHUP"])
     current_mask = player_teams == current_team_abbr.upper()
     current_count = current_mask.sum()
 
@@ -194,24 +215,28 @@ def filter_vs_opponent(
 
 
 def _apply_season_recency(df: pd.DataFrame) -> pd.DataFrame:
-    """Weight rows by how recent the season is."""
+    """Weight rows by how recent the season is.
+
+    Mutates in place — the caller (filter_vs_opponent) owns the copy.
+    """
     if "GAME_DATE" not in df.columns:
         return df
 
-    df = df.copy()
-    df["GAME_DATE"] = pd.to_datetime(df["GAME_DATE"], format="mixed")
-    max_date = df["GAME_DATE"].max()
-
-    def season_weight(game_date: pd.Timestamp) -> float:
-        days_ago = (max_date - game_date).days
-        if days_ago <= 365:      # This season
-            return config.CONTEXT_WEIGHTS["vs_opponent_current"]
-        elif days_ago <= 730:    # Last season
-            return config.CONTEXT_WEIGHTS["vs_opponent_last_szn"]
-        else:
-            return config.CONTEXT_WEIGHTS["vs_opponent_older"]
-
-    df["CTX_WEIGHT"] = df["CTX_WEIGHT"] * df["GAME_DATE"].apply(season_weight)
+    if not pd.api.types.is_datetime64_any_dtype(df["GAME_DATE"]):
+        df["GAME_DATE"] = pd.to_datetime(df["GAME_DATE"], format="mixed", cache=True)
+
+    # Vectorised banding: ≤365 days = this season, ≤730 = last season,
+    # older beyond that — one np.select instead of a Python closure per row
+    days_ago = (df["GAME_DATE"].max() - df["GAME_DATE"]).dt.days.to_numpy()
+    season_weights = np.select(
+        [days_ago <= 365, days_ago <= 730],
+        [
+            config.CONTEXT_WEIGHTS["vs_opponent_current"],
+            config.CONTEXT_WEIGHTS["vs_opponent_last_szn"],
+        ],
+        default=config.CONTEXT_WEIGHTS["vs_opponent_older"],
+    )
+    df["CTX_WEIGHT"] = df["CTX_WEIGHT"].to_numpy() * season_weights
     return df
 
 
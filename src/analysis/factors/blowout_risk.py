@@ -14,12 +14,16 @@ Direction-aware:
 """
 from __future__ import annotations
 
-import sys, os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
+import functools
 
 import config
 from src.models import FactorResult
-from src.api.nba_stats import get_team_avg_win_margin
+from src.api.nba_stats import get_team_avg_win_margin as _fetch_team_avg_win_margin
+
+# In-process memo on (team_id, season). The underlying helper is
+# file-cached, but still pays a disk read + JSON parse per call — and a
+# night's sweep asks about the same handful of teams once per prop.
+get_team_avg_win_margin = functools.lru_cache(maxsize=128)(_fetch_team_avg_win_margin)
 
 # Market-specific blowout sensitivity multipliers (from empirical data)
 # Higher = more affected by blowouts
@@ -5,14 +5,21 @@ The mean component softens the impact of a single bad game tanking the floor con
 """
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
 import config
-import sys, os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
 from src.models import FactorResult
 from src.analysis.context_filter import compute_confidence, effective_sample_size
 
+# Recency-weight prefixes for 1..10 games, raw and pre-normalized. The
+# normalized forms serve the common no-playoff path directly; the raw forms
+# skip the per-call list-slice + asarray when a playoff multiplier applies.
+_W_PREFIX = tuple(
+    np.asarray(config.RECENCY_WEIGHTS_10[:n], dtype=np.float64) for n in range(1, 11)
+)
+_W_PREFIX_NORM = tuple(w / w.sum() for w in _W_PREFIX)
+
 
 def compute(
     df: pd.DataFrame,
@@ -37,28 +44,23 @@ def compute(
             confidence=0.0,
         )
 
-    # Drop zero-weight rows, take last 10 non-OT games where possible
-    valid = df[df.get("CTX_WEIGHT", pd.Series([1.0] * len(df))) > 0].copy()
+    # Drop zero-weight rows, take last 10 non-OT games where possible.
+    # No .copy() — everything below only reads from `valid`.
+    if "CTX_WEIGHT" in df.columns:
+        valid = df.loc[df["CTX_WEIGHT"].to_numpy() > 0]
+    else:
+        valid = df
     if "IS_OT" in valid.columns:
         non_ot = valid[~valid["IS_OT"]]
         if len(non_ot) >= 5:
             valid = non_ot
 
     valid = valid.head(10)
+    values_arr = valid[stat_col].to_numpy(dtype=np.float64)
+    # Evidence strings / result payload keep the column's own dtype so
+    # integer stats still render as "13", not "13.0"
     values = valid[stat_col].tolist()
 
-    # Combine positional recency weights with per-game playoff boost.
-    # Playoff games (PLAYOFF_WEIGHT > 1.0) pull the weighted hit-rate and
-    # mean toward recent playoff performance without discarding RS history.
-    recency = config.RECENCY_WEIGHTS_10[: len(values)]
-    if "PLAYOFF_WEIGHT" in valid.columns:
-        po_boost = valid["PLAYOFF_WEIGHT"].tolist()[: len(values)]
-    else:
-        po_boost = [1.0] * len(values)
-    combined = [r * p for r, p in zip(recency, po_boost)]
-    w_sum = sum(combined)
-    weights = [w / w_sum for w in combined]
-
     if not values:
         return FactorResult(
             name="Consistency",
@@ -69,35 +71,44 @@ def compute(
             confidence=0.0,
         )
 
-    # For UNDER, a "hit" is staying below the line; the ceiling (max) replaces the floor (min)
-    if side == "under":
-        ceiling_value = max(values)
-        hits = [v < line for v in values]
+    # Combine positional recency weights with per-game playoff boost.
+    # Playoff games (PLAYOFF_WEIGHT > 1.0) pull the weighted hit-rate and
+    # mean toward recent playoff performance without discarding RS history.
+    # All array math — no Python-level pass over the rows.
+    if "PLAYOFF_WEIGHT" in valid.columns:
+        combined = _W_PREFIX[len(values) - 1] * valid["PLAYOFF_WEIGHT"].to_numpy(dtype=np.float64)
+        weights = combined / combined.sum()
     else:
-        floor_value = min(values)
-        hits = [v > line for v in values]
+        weights = _W_PREFIX_NORM[len(values) - 1]
 
-    # Weighted hit rate
-    weighted_hit_rate = sum(w * int(h) for w, h in zip(weights, hits))
+    # For UNDER, a "hit" is staying below the line; the ceiling (max) replaces
+    # the floor (min). One reduction per call — reused by the contribution
+    # formula, the evidence label and the result payload below.
+    if side == "under":
+        bound_value = float(values_arr.max())   # ceiling
+        hits = values_arr < line
+    else:
+        bound_value = float(values_arr.min())   # floor
+        hits = values_arr > line
 
-    # Weighted mean
-    weighted_mean = sum(w * v for w, v in zip(weights, values))
+    # Weighted hit rate and weighted mean — two dot products
+    weighted_hit_rate = float(weights @ hits)
+    weighted_mean = float(weights @ values_arr)
 
     if side == "under":
         # Ceiling contribution: how far below the line is the player's ceiling?
-        if ceiling_value < line:
+        if bound_value < line:
             bound_contrib = 1.0  # Even best game stays under — very favourable
         else:
-            bound_contrib = max(0.0, (2 * line - ceiling_value) / line) if line > 0 else 0.0
+            bound_contrib = max(0.0, (2 * line - bound_value) / line) if line > 0 else 0.0
         # Mean contribution (symmetric to OVER): high when mean is well below the line
         mean_contrib = min(1.0, max(0.0, (2 * line - weighted_mean) / line * 0.5)) if line > 0 else 0.5
     else:
-        floor_value = min(values)
         # Floor contribution: how far above the line is the player's floor?
-        if floor_value >= line:
+        if bound_value >= line:
             bound_contrib = 1.0
         else:
-            bound_contrib = max(0.0, floor_value / line) if line > 0 else 0.0
+            bound_contrib = max(0.0, bound_value / line) if line > 0 else 0.0
         # Mean contribution: neutral (0.5) when mean = line, 1.0 when mean = 2×line
         mean_contrib = min(1.0, max(0.0, weighted_mean / line * 0.5)) if line > 0 else 0.5
 
@@ -110,17 +121,18 @@ def compute(
 
     # Evidence
     vals_str = ", ".join(str(round(v, 1)) for v in values)
-    hit_count = sum(hits)
+    hit_count = int(hits.sum())
     total = len(values)
     ot_flag = " (OT games excluded)" if "IS_OT" in df.columns else ""
     po_games = int(valid.get("IS_PLAYOFF_GAME", pd.Series([False] * len(valid))).sum())
     po_flag = f", {po_games} playoff" if po_games > 0 else ""
     if side == "under":
-        bound_label = f"Ceiling={round(ceiling_value, 1)} {'✓ below line' if ceiling_value < line else '✗ above line'}"
+        bound_display = max(values)
+        bound_label = f"Ceiling={round(bound_display, 1)} {'✓ below line' if bound_value < line else '✗ above line'}"
         direction_label = f"{hit_count}/{total} stayed below {line} (line)"
     else:
-        floor_value = min(values)
-        bound_label = f"Floor={round(floor_value, 1)} {'✓ above line' if floor_value >= line else '✗ below line'}"
+        bound_display = min(values)
+        bound_label = f"Floor={round(bound_display, 1)} {'✓ above line' if bound_value >= line else '✗ below line'}"
         direction_label = f"{hit_count}/{total} exceeded {line} (line)"
     mean_vs_line = "above" if weighted_mean >= line else "below"
     evidence = [
@@ -139,8 +151,8 @@ def compute(
         evidence=evidence,
         data={
             "values": values,
-            "floor": min(values) if side == "over" else None,
-            "ceiling": max(values) if side == "under" else None,
+            "floor": bound_display if side == "over" else None,
+            "ceiling": bound_display if side == "under" else None,
             "mean": round(weighted_mean, 2),
             "hit_rate": weighted_hit_rate,
             "hits": hit_count,
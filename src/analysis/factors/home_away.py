@@ -5,11 +5,10 @@ Only uses games from the same location type.
 """
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
 import config
-import sys, os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
 from src.models import FactorResult
 from src.analysis.context_filter import compute_confidence, effective_sample_size
 
@@ -34,17 +33,15 @@ def compute(
             confidence=0.0,
         )
 
-    # Filter to matching location
-    if tonight_is_home:
-        location_mask = df["MATCHUP"].str.contains(r"\bvs\.", case=False, na=False)
-    else:
-        location_mask = df["MATCHUP"].str.contains(r"\s@\s", case=False, na=False)
-
-    filtered = df[location_mask].copy()
-
-    # Also apply CTX_WEIGHT filter
-    if "CTX_WEIGHT" in filtered.columns:
-        filtered = filtered[filtered["CTX_WEIGHT"] > 0]
+    # Filter to matching location. MATCHUP is always "XXX vs. YYY" (home)
+    # or "XXX @ YYY" (away), so a literal substring check on pandas' C
+    # path replaces the regex scan — and the context-weight condition is
+    # ANDed into the same mask so the frame is indexed once.
+    token = " vs. " if tonight_is_home else " @ "
+    mask = df["MATCHUP"].str.contains(token, regex=False, na=False)
+    if "CTX_WEIGHT" in df.columns:
+        mask &= df["CTX_WEIGHT"] > 0
+    filtered = df[mask]
 
     if filtered.empty or stat_col not in filtered.columns:
         return FactorResult(
@@ -56,10 +53,13 @@ def compute(
             confidence=0.0,
         )
 
+    values_arr = filtered[stat_col].to_numpy(dtype=np.float64)
+    # Evidence strings / result payload keep the column's own dtype so
+    # integer stats still render as "13", not "13.0"
     values = filtered[stat_col].tolist()
-    hits = [v < line for v in values] if side == "under" else [v > line for v in values]
-    hit_rate = sum(hits) / len(hits)
-    avg_val = sum(values) / len(values)
+    hits = values_arr < line if side == "under" else values_arr > line
+    hit_rate = float(hits.mean())
+    avg_val = float(values_arr.mean())
 
     if side == "under":
         avg_diff = max(0.0, (line - avg_val) / line) if line > 0 else 0.0
@@ -72,7 +72,7 @@ def compute(
     confidence = compute_confidence(eff_sample, config.MIN_SAMPLE["home_away"])
 
     vals_str = ", ".join(str(round(v, 1)) for v in values[:10])
-    hit_count = sum(hits)
+    hit_count = int(hits.sum())
     direction_verb = "stayed below" if side == "under" else "hit"
     evidence = [
         f"{location_label} games this season: {hit_count}/{len(values)} {direction_verb} (line: {line})",
@@ -8,8 +8,7 @@ Scores the injury situation for the player and both teams.
 """
 from __future__ import annotations
 
-import sys, os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
+import time
 
 import config
 from src.models import FactorResult, InjuryReport
@@ -33,6 +32,33 @@ _DEFAULT_MPG = 15.0
 # Helpers
 # ---------------------------------------------------------------------------
 
+# Token index over the usage table. The source dict itself is held as the
+# validity token — identity comparison against a pinned reference is exact,
+# where an id()-only key could silently match a new dict reusing the same
+# allocation. _current_usage holds one snapshot per TTL window, so the
+# index builds once per snapshot.
+_token_source: dict | None = None
+_token_index: dict[str, dict] = {}
+
+
+def _name_token_index(usage_data: dict) -> dict[str, dict]:
+    """
+    {name_token: stats} for every word of every usage-table name, first
+    occurrence winning — the fallback path for names whose exact key is
+    missing. Built once per usage snapshot so a miss costs two dict
+    lookups instead of a scan over the whole league.
+    """
+    global _token_source, _token_index
+    if usage_data is not _token_source:
+        index: dict[str, dict] = {}
+        for name, s in usage_data.items():
+            for token in name.split():
+                index.setdefault(token, s)
+        _token_index = index
+        _token_source = usage_data
+    return _token_index
+
+
 def _lookup_player_mpg(player_name: str, usage_data: dict) -> tuple[float, bool]:
     """
     Look up a player's MPG from league-wide usage data.
@@ -41,23 +67,64 @@ def _lookup_player_mpg(player_name: str, usage_data: dict) -> tuple[float, bool]
     """
     pname = player_name.strip().lower()
     stats = usage_data.get(pname)
+
+    if stats is None and pname:
+        # Fuzzy match on last name via the token index
+        stats = _name_token_index(usage_data).get(pname.split()[-1])
+
     if stats:
         mpg = stats["mpg"]
         is_star = mpg >= _HIGH_USAGE_MPG or stats.get("fga", 0) >= _HIGH_USAGE_FGA
         return mpg, is_star
 
-    # Fuzzy match on last name
-    last_name = pname.split()[-1] if pname else ""
-    if last_name:
-        for name, s in usage_data.items():
-            if last_name in name:
-                mpg = s["mpg"]
-                is_star = mpg >= _HIGH_USAGE_MPG or s.get("fga", 0) >= _HIGH_USAGE_FGA
-                return mpg, is_star
-
     return _DEFAULT_MPG, False
 
 
+# Resolved (mpg, is_star) per injured player. A sweep asks about the same
+# handful of injured names once per prop, and each miss pays a usage-table
+# fetch plus a fuzzy fallback scan. The memo is scoped to the held usage
+# snapshot — a refresh clears it, so a long-running backend can't serve
+# star statuses older than the table they came from. Only successful
+# lookups are memoized so a failed usage fetch doesn't pin the default.
+_mpg_memo: dict[str, tuple[float, bool]] = {}
+
+# Matches the TTL get_league_player_usage caches under
+_USAGE_REFRESH_SECONDS = config.CACHE_TTL.get("player_team", 43200)
+
+_usage_snapshot: dict | None = None
+_usage_fetched_at: float = 0.0
+
+
+def _current_usage() -> dict:
+    """Process-held league usage snapshot, re-fetched on the cache's own
+    TTL cadence. Holding one dict also gives the token index a stable
+    object to key on. Failed fetches keep any previous snapshot and retry
+    on the next miss."""
+    global _usage_snapshot, _usage_fetched_at
+    now = time.time()
+    if _usage_snapshot is None or now - _usage_fetched_at > _USAGE_REFRESH_SECONDS:
+        snap = get_league_player_usage()
+        if snap:
+            _usage_snapshot = snap
+            _usage_fetched_at = now
+            _mpg_memo.clear()
+        elif _usage_snapshot is None:
+            return {}
+    return _usage_snapshot
+
+
+def _player_mpg(player_name: str) -> tuple[float, bool]:
+    # Freshness check runs before the memo read so a snapshot refresh
+    # (which clears the memo) takes effect for already-resolved names too
+    usage_data = _current_usage()
+    hit = _mpg_memo.get(player_name)
+    if hit is None:
+        hit = _lookup_player_mpg(player_name, usage_data)
+        if usage_data:
+            _mpg_memo[player_name] = hit
+    return hit
+
+
 def _depth_depletion_impact(total_minutes_lost: float) -> float:
     """
     Convert cumulative minutes lost into a score impact (0–30).
@@ -95,6 +162,24 @@ def compute(
 ) -> FactorResult:
     weight = config.FACTOR_WEIGHTS["injury"]
 
+    # No report data at all (off-day / early season) — skip the status and
+    # team lookups entirely; everyone is treated as healthy.
+    if not injury_reports:
+        return FactorResult(
+            name="Injury Context",
+            score=75.0,
+            weight=weight,
+            evidence=[f"{player_name}: healthy ✓ (no injury reports)"],
+            data={
+                "player_status": None,
+                "teammate_injuries": [],
+                "opponent_injuries": [],
+                "depth_minutes_lost": 0.0,
+                "avoid": False,
+            },
+            confidence=1.0,
+        )
+
     # 1. Player's own status — OUT/DOUBTFUL: avoid regardless of side
     player_status = get_player_status(player_name, injury_reports)
     if is_player_unavailable(player_status):
@@ -147,8 +232,10 @@ def compute(
         evidence=evidence,
         data={
             "player_status": player_status,
-            "teammate_injuries": [r.__dict__ for r in teammate_injuries],
-            "opponent_injuries": [r.__dict__ for r in opponent_injuries],
+            # Stored as InjuryReport objects — orjson serializes dataclasses
+            # natively (same JSON as __dict__), so no per-call dict copies.
+            "teammate_injuries": teammate_injuries,
+            "opponent_injuries": opponent_injuries,
             "depth_minutes_lost": depth_minutes_lost,
             "avoid": False,
         },
@@ -180,33 +267,33 @@ def _assess_teammate_impact(
     total_minutes_lost is stored in FactorResult.data for downstream use
     by volume_context (injury-driven minutes boost).
     """
-    usage_data = get_league_player_usage()
     total_minutes_lost = 0.0
     star_impact = 0.0
     injured_names: list[str] = []
+    player_lower = player_name.lower()
+
+    # Per-star market adjustment, resolved once — the loop below only adds it
+    # instead of re-scanning the market string for every injured teammate
+    if "assists" in market:
+        star_delta = 5 if side == "under" else -5
+    elif "points" in market:
+        star_delta = -8 if side == "under" else 8
+    else:
+        star_delta = 0
 
     for inj in teammate_injuries:
-        if inj.player_name.lower() == player_name.lower():
+        if inj.player_name.lower() == player_lower:
             continue  # the player themselves — skip
         if not is_player_unavailable(inj.status):
             continue  # questionable/probable — still expected to play
 
-        mpg, is_star = _lookup_player_mpg(inj.player_name, usage_data)
+        mpg, is_star = _player_mpg(inj.player_name)
         total_minutes_lost += mpg
         injured_names.append(f"{inj.player_name} ({inj.status}, ~{mpg:.0f} MPG)")
 
         # Star-specific market adjustments (layered on top of depth base)
         if is_star:
-            if "assists" in market:
-                if side == "under":
-                    star_impact += 5
-                else:
-                    star_impact -= 5
-            elif "points" in market:
-                if side == "under":
-                    star_impact -= 8
-                else:
-                    star_impact += 8
+            star_impact += star_delta
 
     # --- Base depth depletion score (applies to ALL markets) ---
     depth_impact = _depth_depletion_impact(total_minutes_lost)
@@ -260,30 +347,31 @@ def _assess_opponent_impact(
     Opponent injuries weaken the opposition.
     Two-tier: base depletion + star bonuses for relevant markets.
     """
-    usage_data = get_league_player_usage()
     total_opp_minutes_lost = 0.0
     star_impact = 0.0
+    star_out = False
     opp_injured_names: list[str] = []
 
+    # Star bonus only applies on scoring/rebounding/assist markets —
+    # resolve the market test and the per-star delta once, outside the loop
+    is_relevant = (
+        "points" in market or "rebounds" in market or
+        "assists" in market or "pra" in market.lower()
+    )
+    star_delta = (-7 if side == "under" else 7) if is_relevant else 0
+
     for inj in opponent_injuries:
         if not is_player_unavailable(inj.status):
             continue
 
-        mpg, is_star = _lookup_player_mpg(inj.player_name, usage_data)
+        mpg, is_star = _player_mpg(inj.player_name)
+        star_out = star_out or is_star
         total_opp_minutes_lost += mpg
         opp_injured_names.append(f"{inj.player_name} ({inj.status})")
 
         # Star-specific bonuses for scoring/rebounding/assist markets
         if is_star:
-            is_relevant = (
-                "points" in market or "rebounds" in market or
-                "assists" in market or "pra" in market.lower()
-            )
-            if is_relevant:
-                if side == "under":
-                    star_impact -= 7
-                else:
-                    star_impact += 7
+            star_impact += star_delta
 
     # Base opponent depletion (team-wide weakness)
     base_opp_impact = 0.0
@@ -302,11 +390,9 @@ def _assess_opponent_impact(
                 f"Opponent depleted: {n_out} players out (~{total_opp_minutes_lost:.0f} min) "
                 f"→ {'weaker defence +' if side == 'over' else 'works against UNDER'}"
             )
-        elif n_out > 0 and any(
-            _lookup_player_mpg(inj.player_name, usage_data)[1]
-            for inj in opponent_injuries if is_player_unavailable(inj.status)
-        ):
-            # At least one star out but total minutes not extreme
+        elif star_out:
+            # At least one star out but total minutes not extreme —
+            # flag tracked in the loop above; no second lookup pass
             for name_str in opp_injured_names[:2]:
                 direction = "defence weakened +" if side == "over" else "weaker defence (works against UNDER)"
                 evidence.append(f"Opponent {name_str} — {direction}")
@@ -13,9 +13,6 @@ Includes market-specific pace adjustment:
 """
 from __future__ import annotations
 
-import sys, os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
-
 import config
 from src.models import FactorResult
 from src.api.nba_stats import get_opponent_defensive_profile
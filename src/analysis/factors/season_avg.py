@@ -10,8 +10,6 @@ import numpy as np
 import pandas as pd
 
 import config
-import sys, os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
 from src.models import FactorResult
 from src.analysis.context_filter import compute_confidence
 
@@ -38,28 +36,44 @@ def compute(
             confidence=0.0,
         )
 
-    # Use all current-season games, sorted most recent first
-    df = df.copy()
+    # Work on the underlying arrays — no frame copy, no column reassignment.
+    # The fetchers already deliver GAME_DATE as datetime64; parse only when a
+    # caller hands us raw strings.
+    vals = df[stat_col].to_numpy(dtype=np.float64)
+    games_played = len(vals)
+
+    # Most-recent-first ordering for the rolling window (the full-season
+    # average is order-independent)
     if "GAME_DATE" in df.columns:
-        df["GAME_DATE"] = pd.to_datetime(df["GAME_DATE"], format="mixed")
-        df = df.sort_values("GAME_DATE", ascending=False).reset_index(drop=True)
+        dates = df["GAME_DATE"]
+        if not pd.api.types.is_datetime64_any_dtype(dates):
+            dates = pd.to_datetime(dates, format="mixed", cache=True)
+        order = np.argsort(dates.to_numpy())[::-1]
+    else:
+        order = np.arange(games_played)
 
     # Use playoff-weighted average when blended data is present so that
     # playoff games (PLAYOFF_WEIGHT > 1.0) pull the season average toward
     # the player's actual playoff-era form.
-    if "PLAYOFF_WEIGHT" in df.columns and df["PLAYOFF_WEIGHT"].nunique() > 1:
-        full_avg = float(np.average(df[stat_col], weights=df["PLAYOFF_WEIGHT"]))
+    po_weights = None
+    if "PLAYOFF_WEIGHT" in df.columns:
+        w = df["PLAYOFF_WEIGHT"].to_numpy(dtype=np.float64)
+        if games_played and (w != w[0]).any():
+            po_weights = w
+
+    if po_weights is not None:
+        full_avg = float(np.average(vals, weights=po_weights))
     else:
-        full_avg = float(df[stat_col].mean())
-    games_played = len(df)
+        full_avg = float(vals.mean())
 
     # Rolling 20-game average for role-change detection
-    rolling_df = df.head(config.ROLE_CHANGE_WINDOW)
-    if len(rolling_df) >= 5:
-        if "PLAYOFF_WEIGHT" in rolling_df.columns and rolling_df["PLAYOFF_WEIGHT"].nunique() > 1:
-            rolling_avg = float(np.average(rolling_df[stat_col], weights=rolling_df["PLAYOFF_WEIGHT"]))
+    rolling_idx = order[: config.ROLE_CHANGE_WINDOW]
+    if len(rolling_idx) >= 5:
+        rw = po_weights[rolling_idx] if po_weights is not None else None
+        if rw is not None and (rw != rw[0]).any():
+            rolling_avg = float(np.average(vals[rolling_idx], weights=rw))
         else:
-            rolling_avg = float(rolling_df[stat_col].mean())
+            rolling_avg = float(vals[rolling_idx].mean())
     else:
         rolling_avg = full_avg
 
@@ -114,7 +128,7 @@ def compute(
             f"Role change detected — season avg {full_avg:.1f} vs recent {rolling_avg:.1f} "
             f"(using last {config.ROLE_CHANGE_WINDOW} games)"
         )
-    po_games = int(df.get("IS_PLAYOFF_GAME", pd.Series([False] * len(df))).sum()) if "IS_PLAYOFF_GAME" in df.columns else 0
+    po_games = int(df["IS_PLAYOFF_GAME"].sum()) if "IS_PLAYOFF_GAME" in df.columns else 0
     blend_note = f" [{po_games} playoff, {games_played - po_games} RS, weighted {config.PLAYOFF_GAME_WEIGHT}x]" if po_games > 0 else ""
     evidence.append(
         f"Season avg: {full_avg:.1f}{blend_note} ({games_played} games) | "
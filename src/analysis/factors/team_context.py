@@ -8,9 +8,6 @@ UNDER: slow pace = fewer possessions = harder to exceed line (pace inverted);
 """
 from __future__ import annotations
 
-import sys, os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
-
 import config
 from src.models import FactorResult
 from src.api.nba_stats import get_team_pace_rank, get_team_recent_form
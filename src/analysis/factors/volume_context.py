@@ -20,8 +20,6 @@ from __future__ import annotations
 import pandas as pd
 
 import config
-import sys, os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
 from src.models import FactorResult
 
 # Markets that benefit from FGA-based usage scoring
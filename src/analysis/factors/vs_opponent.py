@@ -8,8 +8,6 @@ from __future__ import annotations
 import pandas as pd
 
 import config
-import sys, os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
 from src.models import FactorResult
 from src.analysis.context_filter import (
     filter_vs_opponent,
@@ -7,9 +7,6 @@ from __future__ import annotations
 import pandas as pd
 
 import config
-import sys, os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-
 from src.models import PlayerProp, ValuedProp, FactorResult, InjuryReport
 from src.api.nba_stats import (
     get_player_game_log,
@@ -53,10 +50,9 @@ def grade_prop(
     if not market_cfg:
         return None
 
-    # stat_col: for simple markets (compute is a string like "PTS") use compute directly;
-    # for combo markets (compute is a lambda) use stat_key (e.g. "PRA" pre-computed column)
-    compute_fn = market_cfg["compute"]
-    stat_col = market_cfg["stat_key"] if callable(compute_fn) else compute_fn
+    # stat_col: simple markets read their own column (e.g. "PTS"); combo
+    # markets use the precomputed column named by stat_key (e.g. "PRA")
+    stat_col = market_cfg["stat_key"]
 
     # --- Fetch blended game log (RS + playoff if active) so we can exit early ---
     df_raw = get_player_game_log_blended(prop.nba_player_id, season=season)
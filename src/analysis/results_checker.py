@@ -18,11 +18,6 @@ Combo markets (PRA, PR, PA, RA) are computed by summing component stats.
 from __future__ import annotations
 
 import time
-import sys
-import os
-
-# Ensure project root is on sys.path when this module is imported standalone
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
 import config
 from src.database import (
@@ -36,10 +36,7 @@ def compute_value_score(factors: list[FactorResult]) -> float:
 
 
 def label_recommendation(score: float) -> str:
-    for threshold, label in config.SCORE_LABELS:
-        if score >= threshold:
-            return label
-    return "Poor Value"
+    return config.label_score(score)
 
 
 def detect_suspicious_line(
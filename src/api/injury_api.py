@@ -8,13 +8,14 @@ from __future__ import annotations
 import requests
 
 import config
-import sys, os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from src.cache import get as cache_get, set as cache_set
 from src.models import InjuryReport
 
 _CACHE_KEY = "espn_injuries"
 
+# Shared session so repeated fetches reuse the TCP+TLS connection to ESPN
+_session = requests.Session()
+
 # ESPN uses different abbreviations than nba_api for some teams.
 # Normalise ESPN → nba_api standard abbreviations.
 _ESPN_ABBR_FIX: dict[str, str] = {
@@ -45,7 +46,7 @@ def get_injury_report() -> list[InjuryReport]:
         return [InjuryReport(**r) for r in cached]
 
     try:
-        resp = requests.get(config.ESPN_INJURY_URL, timeout=10)
+        resp = _session.get(config.ESPN_INJURY_URL, timeout=10)
         resp.raise_for_status()
         data = resp.json()
     except Exception:
@@ -89,30 +90,72 @@ def get_injury_report() -> list[InjuryReport]:
     return reports
 
 
+# ---------------------------------------------------------------------------
+# Per-sweep lookup index
+# ---------------------------------------------------------------------------
+# A grading sweep passes the same reports list into every compute call, so
+# the per-team slices, the name list for fuzzy matching and resolved player
+# statuses are built/memoized once per distinct list instead of rescanned
+# per prop. The indexed list itself is kept as the validity token: holding
+# the strong reference pins its id, so an identity check is exact — a fresh
+# fetch produces a new list object, which invalidates the index.
+
+_indexed_reports: list[InjuryReport] | None = None
+_by_team: dict[str, list[InjuryReport]] = {}
+_names: list[str] = []
+_status_by_name: dict[str, str] = {}
+_status_memo: dict[str, str | None] = {}
+
+
+def _index(reports: list[InjuryReport]) -> None:
+    global _indexed_reports, _by_team, _names, _status_by_name, _status_memo
+    if reports is _indexed_reports:
+        return
+    by_team: dict[str, list[InjuryReport]] = {}
+    status_by_name: dict[str, str] = {}
+    for r in reports:
+        by_team.setdefault(r.team.upper(), []).append(r)
+        # first occurrence wins — matches the old first-match scan
+        status_by_name.setdefault(r.player_name, r.status)
+    _by_team = by_team
+    _names = [r.player_name for r in reports]
+    _status_by_name = status_by_name
+    _status_memo = {}
+    _indexed_reports = reports
+
+
 def get_player_status(player_name: str, reports: list[InjuryReport]) -> str | None:
     """
     Look up a player's injury status from the report list.
     Uses fuzzy matching. Returns None if not found (assumed healthy).
+    Results are memoized per report list, so each unique player pays the
+    fuzzy scan once per sweep.
     """
     from thefuzz import process
 
     if not reports:
         return None
 
-    names = [r.player_name for r in reports]
-    match, score = process.extractOne(player_name, names)
-    if score < 80:
-        return None
+    _index(reports)
+    if player_name in _status_memo:
+        return _status_memo[player_name]
 
-    for r in reports:
-        if r.player_name == match:
-            return r.status
-    return None
+    match, score = process.extractOne(player_name, _names)
+    status = _status_by_name.get(match) if score >= 80 else None
+    _status_memo[player_name] = status
+    return status
 
 
 def get_team_injuries(team_abbr: str, reports: list[InjuryReport]) -> list[InjuryReport]:
-    """Return all injury reports for a specific team."""
-    return [r for r in reports if r.team.upper() == team_abbr.upper()]
+    """Return all injury reports for a specific team.
+
+    Served from the per-sweep index — callers treat the list as
+    read-only.
+    """
+    if not reports:
+        return []
+    _index(reports)
+    return _by_team.get(team_abbr.upper(), [])
 
 
 def is_player_unavailable(status: str | None) -> bool:
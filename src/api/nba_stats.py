@@ -5,7 +5,10 @@ All calls are cached. nba_api calls are rate-limited with a sleep between them.
 """
 from __future__ import annotations
 
+import functools
+import threading
 import time
+import unicodedata
 from datetime import datetime, timezone, timedelta
 from typing import Any
 from zoneinfo import ZoneInfo
@@ -30,8 +33,6 @@ from nba_api.stats.static import players as nba_players_static
 from nba_api.stats.static import teams as nba_teams_static
 
 import config
-import sys, os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from src.cache import get as cache_get, set as cache_set
 from src.models import NBAGame
 
@@ -44,12 +45,62 @@ def _sleep() -> None:
 # Static lookups
 # ---------------------------------------------------------------------------
 
+# Single-pass punctuation strip for name normalisation — one C-level
+# translate instead of chained .replace() allocations
+_NAME_TBL = str.maketrans({"'": "", ".": "", "-": " "})
+
+
+def _norm_name(name: str) -> str:
+    """Fold accents/punctuation/case so bookmaker spellings share one cache
+    entry ("Luka Dončić" ≡ "Luka Doncic" ≡ "luka doncic")."""
+    ascii_name = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode()
+    return ascii_name.translate(_NAME_TBL).lower().strip()
+
+
+# Resolved name→id map persisted through the file cache so warm runs skip
+# the fuzzy scan entirely. Misses are stored as None (negative cache) and
+# age out with the map's TTL. Loaded lazily once per process. The lock
+# serialises map updates and persists — resolve workers run 8-16 wide and
+# must not snapshot the dict mid-insert or interleave writes.
+_player_ids_disk: dict[str, int | None] | None = None
+_player_ids_lock = threading.Lock()
+
+
+def _disk_player_ids() -> dict[str, int | None]:
+    global _player_ids_disk
+    if _player_ids_disk is None:
+        with _player_ids_lock:
+            if _player_ids_disk is None:
+                _player_ids_disk = cache_get("player_ids", config.CACHE_TTL["player_ids"]) or {}
+    return _player_ids_disk
+
+
 def get_player_id(name: str) -> int | None:
-    """Fuzzy player name → nba_api player ID."""
+    """Fuzzy player name → nba_api player ID.
+
+    Memoized on the normalised name — the fuzzy match scans every name
+    in the static player list, and the same player shows up once per
+    market per game (often spelled differently per bookmaker). Resolved
+    names (including misses) persist across runs via the file cache, so
+    a warm run resolves its whole slate without a single fuzzy scan.
+    """
+    norm = _norm_name(name)
+    known = _disk_player_ids()
+    if norm in known:
+        return known[norm]
+    pid = _player_id_for_norm(norm)   # slow fuzzy scan — outside the lock
+    with _player_ids_lock:
+        known[norm] = pid
+        cache_set("player_ids", dict(known))
+    return pid
+
+
+@functools.lru_cache(maxsize=4096)
+def _player_id_for_norm(norm_name: str) -> int | None:
     from thefuzz import process
     all_players = nba_players_static.get_players()
     names = [p["full_name"] for p in all_players]
-    match, score = process.extractOne(name, names)
+    match, score = process.extractOne(norm_name, names)
     if score < 75:
         return None
     for p in all_players:
@@ -186,7 +237,13 @@ def get_player_game_log(
     cache_key = f"gamelog_{player_id}_{season}_{season_type}"
     cached = cache_get(cache_key, config.CACHE_TTL["game_log"])
     if cached:
-        return pd.DataFrame(cached)
+        df = pd.DataFrame(cached)
+        # GAME_DATE was datetime64 when serialised, so the cached strings
+        # are ISO — retype once here instead of per factor downstream
+        # (format="mixed" element inspection is the slow path)
+        if "GAME_DATE" in df.columns:
+            df["GAME_DATE"] = pd.to_datetime(df["GAME_DATE"], format="ISO8601", cache=True)
+        return df
 
     _sleep()
     try:
@@ -268,7 +325,10 @@ def get_player_game_log_blended(
         return frames[0]
 
     df = pd.concat(frames, ignore_index=True)
-    df["GAME_DATE"] = pd.to_datetime(df["GAME_DATE"], format="mixed")
+    # Both source frames come out of get_player_game_log already typed;
+    # only re-parse if something upstream handed back strings
+    if not pd.api.types.is_datetime64_any_dtype(df["GAME_DATE"]):
+        df["GAME_DATE"] = pd.to_datetime(df["GAME_DATE"], format="mixed", cache=True)
     df = df.sort_values("GAME_DATE", ascending=False).reset_index(drop=True)
     return df
 
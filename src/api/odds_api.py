@@ -18,8 +18,6 @@ import requests
 from typing import Any
 
 import config
-import sys
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from src.cache import (
     get as cache_get,
     set as cache_set,
@@ -30,6 +28,12 @@ from src.cache import (
 from src.models import NBAGame, PlayerProp
 
 
+# Shared session — reuses TCP+TLS connections across the dozens of calls a
+# refresh makes instead of paying the handshake per request. requests.Session
+# is thread-safe for concurrent gets, which the parallel fetch pools rely on.
+_session = requests.Session()
+
+
 # ---------------------------------------------------------------------------
 # API Key Pool — automatic rotation across multiple keys
 # ---------------------------------------------------------------------------
@@ -167,7 +171,7 @@ def _get(path: str, params: dict) -> dict | list | None:
     params.setdefault("oddsFormat", "decimal")
     url = f"{config.ODDS_API_BASE_URL}{path}"
     try:
-        resp = requests.get(url, params=params, timeout=15)
+        resp = _session.get(url, params=params, timeout=15)
         # Sync credit counter from response headers
         raw_used = resp.headers.get("x-requests-used")
         raw_remaining = resp.headers.get("x-requests-remaining")
@@ -199,7 +203,7 @@ def _get(path: str, params: dict) -> dict | list | None:
             if next_key and next_key != api_key:
                 print(f"[odds-api] ↻ Retrying with key ...{_khash(next_key)}")
                 params["apiKey"] = next_key
-                resp2 = requests.get(url, params=params, timeout=15)
+                resp2 = _session.get(url, params=params, timeout=15)
                 raw_used2 = resp2.headers.get("x-requests-used")
                 raw_remaining2 = resp2.headers.get("x-requests-remaining")
                 if raw_used2 is not None:
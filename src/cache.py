@@ -9,28 +9,33 @@ from __future__ import annotations
 import hashlib
 import json
 import os
+import pickle
+import threading
 import time
 from datetime import datetime, date
 from typing import Any
 
+import orjson
+
 import config
 
 
-class _Encoder(json.JSONEncoder):
-    """Handles types that pandas/nba_api produce that stock json can't handle."""
-    def default(self, obj: Any) -> Any:
-        # pandas Timestamp, datetime, date → ISO string
-        if hasattr(obj, "isoformat"):
-            return obj.isoformat()
-        # numpy int/float scalars
-        if hasattr(obj, "item"):
-            return obj.item()
-        return super().default(obj)
+def _json_default(obj: Any) -> Any:
+    """Handles types that pandas/nba_api produce that orjson can't natively."""
+    # pandas Timestamp, datetime, date → ISO string
+    if hasattr(obj, "isoformat"):
+        return obj.isoformat()
+    # numpy int/float scalars
+    if hasattr(obj, "item"):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 _COUNTER_FILE = os.path.join(config.CACHE_DIR, "api_credits.json")
 _MONTHLY_LIMIT_DEFAULT = 500   # fallback if we haven't seen a response header yet
 
 
+# config creates CACHE_DIR at import; this guard only matters if something
+# removes the directory mid-run
 def _ensure_dir() -> None:
     os.makedirs(config.CACHE_DIR, exist_ok=True)
 
@@ -46,25 +51,38 @@ def _cache_path(key: str) -> str:
 
 def get(key: str, ttl_seconds: int) -> Any | None:
     """Return cached value if it exists and is not stale, else None."""
-    path = _cache_path(key)
-    if not os.path.exists(path):
-        return None
     try:
-        with open(path) as f:
-            entry = json.load(f)
+        # Open directly and catch FileNotFoundError — saves the extra
+        # os.path.exists stat on every warm hit
+        with open(_cache_path(key), "rb") as f:
+            entry = orjson.loads(f.read())
         if time.time() - entry["ts"] > ttl_seconds:
             return None
         return entry["data"]
-    except (json.JSONDecodeError, KeyError):
+    except (FileNotFoundError, orjson.JSONDecodeError, KeyError):
         return None
 
 
 def set(key: str, data: Any) -> None:
-    """Persist data to cache with current timestamp."""
-    _ensure_dir()
+    """Persist data to cache with current timestamp.
+
+    orjson encodes/decodes several times faster than stdlib json and emits
+    the same format, so existing cache files stay readable. The write goes
+    through a temp file + os.replace so a crash mid-write can't leave a
+    truncated entry for readers. The temp name carries pid + thread id so
+    concurrent writers to the same key each replace atomically
+    (last writer wins) instead of sharing one temp file.
+    """
     path = _cache_path(key)
-    with open(path, "w") as f:
-        json.dump({"ts": time.time(), "data": data}, f, cls=_Encoder)
+    payload = orjson.dumps(
+        {"ts": time.time(), "data": data},
+        default=_json_default,
+        option=orjson.OPT_SERIALIZE_NUMPY,
+    )
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
 
 
 def invalidate(key: str) -> None:
@@ -101,6 +119,47 @@ def load_scored_props_raw(
     return get(f"scored_props_{date_str}", max_age_seconds)
 
 
+def _bin_path(date_str: str) -> str:
+    return os.path.join(config.CACHE_DIR, f"scored_props_{date_str}.pkl")
+
+
+def save_scored_props_bin(vps: list, date_str: str | None = None) -> None:
+    """
+    Persist ValuedProp objects directly via pickle, alongside the JSON cache.
+
+    The CLI slips path reads this back with no dict→dataclass
+    reconstruction at all; the JSON cache stays the canonical format for
+    the backend, which serves the raw dicts. Same temp-file + os.replace
+    discipline as set() so readers never see a truncated file.
+    """
+    if date_str is None:
+        date_str = date.today().isoformat()
+    path = _bin_path(date_str)
+    payload = pickle.dumps({"ts": time.time(), "data": vps}, protocol=pickle.HIGHEST_PROTOCOL)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+
+def load_scored_props_bin(
+    date_str: str | None = None,
+    max_age_seconds: int = 129_600,   # 36 hours, same TTL as the JSON cache
+) -> list | None:
+    """Return the pickled ValuedProp list, or None if absent / stale / unreadable."""
+    if date_str is None:
+        date_str = date.today().isoformat()
+    try:
+        with open(_bin_path(date_str), "rb") as f:
+            entry = pickle.loads(f.read())
+        if time.time() - entry["ts"] > max_age_seconds:
+            return None
+        return entry["data"]
+    except (FileNotFoundError, KeyError, pickle.UnpicklingError, EOFError, AttributeError):
+        # AttributeError: pickle from an older code version whose classes moved
+        return None
+
+
 # ---------------------------------------------------------------------------
 # Odds API credit counter
 # ---------------------------------------------------------------------------
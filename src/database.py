@@ -56,7 +56,17 @@ def _normalise_factor_scores(factors: list) -> dict[str, float | None]:
 # Connection
 # ---------------------------------------------------------------------------
 
+_schema_ready = False
+
+
 def _connect() -> sqlite3.Connection:
+    """Open a connection, creating the schema on first use in this process."""
+    if not _schema_ready:
+        init_db()
+    return _raw_connect()
+
+
+def _raw_connect() -> sqlite3.Connection:
     conn = sqlite3.connect(config.DATABASE_PATH)
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA foreign_keys = ON")
@@ -69,8 +79,16 @@ def _connect() -> sqlite3.Connection:
 # ---------------------------------------------------------------------------
 
 def init_db() -> None:
-    """Create all tables if they don't exist. Safe to call on every startup."""
-    with _connect() as conn:
+    """Create all tables if they don't exist. Safe to call on every startup.
+
+    One-shot per process — _connect triggers it lazily on first DB use, so
+    commands that never touch the database skip the CREATE TABLE pass
+    entirely, and repeat calls return instantly.
+    """
+    global _schema_ready
+    if _schema_ready:
+        return
+    with _raw_connect() as conn:
         conn.executescript("""
             CREATE TABLE IF NOT EXISTS grading_runs (
                 id             INTEGER PRIMARY KEY,
@@ -175,6 +193,10 @@ def init_db() -> None:
                 ON graded_props(player_name, market, line, side, game_date);
             CREATE INDEX IF NOT EXISTS idx_graded_props_date
                 ON graded_props(game_date);
+            -- Matches the ORDER BY of get_prop_results so SQLite can walk the
+            -- index instead of sorting the result set
+            CREATE INDEX IF NOT EXISTS idx_graded_props_date_score
+                ON graded_props(game_date DESC, value_score DESC);
         """)
 
         # Users table — for auth & multi-user support
@@ -223,6 +245,8 @@ def init_db() -> None:
         except Exception:
             pass
 
+    _schema_ready = True
+
 
 # ---------------------------------------------------------------------------
 # Grading runs
@@ -399,32 +423,41 @@ def save_slip(
 # History
 # ---------------------------------------------------------------------------
 
-def get_history(limit: int = 20, user_id: int | None = None) -> list[dict]:
-    """Return saved slips (newest first) with their legs nested in.
-    If user_id is provided, only return slips belonging to that user."""
-    with _connect() as conn:
+def iter_history(limit: int = 20, user_id: int | None = None):
+    """Yield saved slips (newest first) one at a time with legs nested in.
+
+    Generator counterpart of get_history — rows stream to the caller as
+    the cursor produces them, so the CLI can render incrementally instead
+    of materialising every slip before the first row appears.
+    """
+    conn = _connect()
+    try:
         if user_id is not None:
-            slips = conn.execute(
+            cur = conn.execute(
                 "SELECT * FROM saved_slips WHERE user_id = ? ORDER BY saved_at DESC LIMIT ?",
                 (user_id, limit),
-            ).fetchall()
+            )
         else:
-            slips = conn.execute(
+            cur = conn.execute(
                 "SELECT * FROM saved_slips ORDER BY saved_at DESC LIMIT ?",
                 (limit,),
-            ).fetchall()
-
-        result = []
-        for slip in slips:
+            )
+        for slip in cur:
             legs = conn.execute(
                 "SELECT * FROM slip_legs WHERE slip_id = ? ORDER BY id",
                 (slip["id"],),
             ).fetchall()
             slip_dict = dict(slip)
             slip_dict["legs"] = [dict(leg) for leg in legs]
-            result.append(slip_dict)
+            yield slip_dict
+    finally:
+        conn.close()
+
 
-        return result
+def get_history(limit: int = 20, user_id: int | None = None) -> list[dict]:
+    """Return saved slips (newest first) with their legs nested in.
+    If user_id is provided, only return slips belonging to that user."""
+    return list(iter_history(limit=limit, user_id=user_id))
 
 
 # ---------------------------------------------------------------------------
@@ -1068,6 +1101,7 @@ def get_prop_results(
     min_score:  float | None = None,
     result:     str | None = None,   # "HIT" | "MISS"
     side:       str | None = None,   # "over" | "under"
+    bookmaker:  str | None = None,
     picks_only: bool = False,
     active_only: bool = False,
     graded_only: bool = True,
@@ -1119,6 +1153,9 @@ def get_prop_results(
     if side in ("over", "under"):
         conditions.append("side = ?")
         params.append(side)
+    if bookmaker:
+        conditions.append("bookmaker = ?")
+        params.append(bookmaker)
 
     where = " AND ".join(conditions) if conditions else "1=1"
     params.append(limit)
@@ -103,6 +103,10 @@ def make_progress() -> Progress:
         TimeElapsedColumn(),
         console=console,
         transient=False,
+        # Cap render rate — per-item updates otherwise trigger a full
+        # re-render each, and serialize behind Rich's lock under the
+        # parallel grading loop
+        refresh_per_second=8,
     )
 
 
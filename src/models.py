@@ -1,5 +1,6 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Callable
 
 
@@ -56,6 +57,42 @@ class ValuedProp:
     suspicious_line: bool = False       # True if line looks like a trap
     suspicious_reason: str = ""
 
+    @cached_property
+    def decimal_odds(self) -> float:
+        """Decimal odds for the graded side, computed once per instance.
+
+        The bet builder reads this for every prop it considers; caching
+        here means the side lookup happens once per prop, not once per
+        combination containing it.
+        """
+        if (
+            self.backing_data.get("side", "over") == "under"
+            and self.prop.under_odds_decimal
+            and self.prop.under_odds_decimal > 1.0
+        ):
+            return self.prop.under_odds_decimal
+        return self.prop.over_odds_decimal
+
+    def to_dict(self) -> dict:
+        """dataclasses.asdict()-compatible dict via direct attribute access.
+
+        asdict() deep-copies every nested field recursively; over hundreds
+        of props that copy dominates the serialize phase. Serialisation
+        only reads the structure, so sharing the evidence/data references
+        is safe — callers must not mutate the returned dict in place.
+        """
+        prop = dict(self.prop.__dict__)
+        prop["game"] = dict(self.prop.game.__dict__)
+        return {
+            "prop": prop,
+            "value_score": self.value_score,
+            "factors": [dict(f.__dict__) for f in self.factors],
+            "recommendation": self.recommendation,
+            "backing_data": self.backing_data,
+            "suspicious_line": self.suspicious_line,
+            "suspicious_reason": self.suspicious_reason,
+        }
+
 
 @dataclass
 class BetLeg: